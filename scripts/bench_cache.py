@@ -0,0 +1,76 @@
+"""
+Cache codec benchmark: bytes per entry and encode/decode cost per codec.
+
+    python -m scripts.bench_cache [--rounds 2000]
+
+Entries are built from the UI mock responses, so sizes are representative
+of real flight results.
+"""
+import argparse
+import time
+from pathlib import Path
+
+import orjson
+
+from src.infra.cache import (
+    CODEC_JSON, CODEC_ZLIB_DICT, decode_entry, encode_entry,
+)
+
+MOCKS = Path(__file__).resolve().parents[1] / \
+    "flight-copilot-ui" / "src" / "mocks"
+CODECS = {"json (v1)": CODEC_JSON, "zlib+dict": CODEC_ZLIB_DICT}
+
+
+def load_entries() -> list[bytes]:
+    entries = []
+    for name in ("travelpayouts.json", "new-flights.json", "agent-response.json"):
+        data = orjson.loads((MOCKS / name).read_bytes())
+        options = data.get("options", [])
+        entries.append(orjson.dumps({"options": options}))
+        # small result sets are common too (max=1..3)
+        entries.extend(orjson.dumps({"options": options[i:i + 2]})
+                       for i in range(0, len(options), 2))
+    return entries
+
+
+def bench(entries: list[bytes], codec: int, rounds: int) -> dict:
+    encoded = [encode_entry(e, codec) for e in entries]
+    assert [decode_entry(e) for e in encoded] == entries
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for e in entries:
+            encode_entry(e, codec)
+    enc_us = (time.perf_counter() - t0) / (rounds * len(entries)) * 1e6
+
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for e in encoded:
+            decode_entry(e)
+    dec_us = (time.perf_counter() - t0) / (rounds * len(entries)) * 1e6
+
+    return {
+        "bytes": sum(map(len, encoded)) / len(encoded),
+        "encode_us": enc_us,
+        "decode_us": dec_us,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    entries = load_entries()
+    raw_avg = sum(map(len, entries)) / len(entries)
+    print(f"{len(entries)} entries, avg {raw_avg:.0f} raw JSON bytes\n")
+    print(f"{'codec':<12}{'bytes/entry':>12}{'ratio':>8}"
+          f"{'encode us':>11}{'decode us':>11}")
+    for name, codec in CODECS.items():
+        r = bench(entries, codec, args.rounds)
+        print(f"{name:<12}{r['bytes']:>12.0f}{raw_avg / r['bytes']:>8.2f}"
+              f"{r['encode_us']:>11.1f}{r['decode_us']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
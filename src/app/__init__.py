@@ -0,0 +1,4 @@
+import time
+
+# reference point for the cold-start timing logged by src.app.app
+IMPORT_STARTED = time.perf_counter()
@@ -1,15 +1,64 @@
+import threading
+import time
+from src.app import IMPORT_STARTED
 from src.infra.airports.airports_loader import load_airports
-from .routers import flights, agent, locations
+from src.infra.cache import require_redis
+from src.app.deps import (
+    get_agent_jobs, get_fx_refresher, get_llm_agent, get_watch_scheduler,
+)
+from src.config import get_settings
+from src.utils.logger import get_logger
+from src.utils.memory import process_memory
+from .routers import (
+    admin, flights, agent, agent_jobs, locations, price_calendar, watches,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
 
+log = get_logger()
+settings = get_settings()
+_import_ms = (time.perf_counter() - IMPORT_STARTED) * 1000
 
 app = FastAPI(title="Flight Copilot API", version="1.0.0")
 
 
+def _warmup_agent():
+    started = time.perf_counter()
+    try:
+        get_llm_agent()
+        log.info("[Startup] Agent warmed up in %.0f ms",
+                 (time.perf_counter() - started) * 1000)
+    except Exception as e:
+        log.warning("[Startup] Agent warmup failed: %s", e)
+
+
 @app.on_event("startup")
 def startup_event():
+    started = time.perf_counter()
     load_airports()
+    if settings.redis_required:
+        require_redis()
+    # with queued agent jobs the LLM runs in worker processes, not here
+    if settings.agent_warmup and settings.agent_jobs_mode != "redis":
+        threading.Thread(target=_warmup_agent, name="agent-warmup",
+                         daemon=True).start()
+    if settings.watch_scheduler:
+        get_watch_scheduler().start()
+    # the bundled static rates are used until the first refresh lands
+    if settings.fx_refresh_sec > 0:
+        get_fx_refresher().start()
+    startup_ms = (time.perf_counter() - started) * 1000
+    app.state.startup_ms = {"import": round(_import_ms),
+                            "startup": round(startup_ms)}
+    log.info("[Startup] Ready: imports %.0f ms, startup %.0f ms",
+             _import_ms, startup_ms)
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    get_agent_jobs().shutdown()
+    get_watch_scheduler().stop()
+    get_fx_refresher().stop()
 
 
 app.add_middleware(
@@ -25,9 +74,18 @@ app.add_middleware(
 
 app.include_router(flights.router,   prefix="/api", tags=["flights"])
 app.include_router(agent.router,     prefix="/api", tags=["agent"])
+app.include_router(agent_jobs.router, prefix="/api", tags=["agent"])
 app.include_router(locations.router, prefix="/api", tags=["locations"])
+app.include_router(price_calendar.router, prefix="/api", tags=["flights"])
+app.include_router(watches.router, prefix="/api", tags=["watches"])
+app.include_router(admin.router, tags=["admin"])
 
 
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return {"ok": True, "startup_ms": getattr(app.state, "startup_ms", None)}
+
+
+@app.get("/health/memory")
+def health_memory():
+    return process_memory()
@@ -1,10 +1,23 @@
+import threading
 from functools import lru_cache
+from fastapi import Header, HTTPException, Query
 from src.config import get_settings
 from src.providers.amadeus_client import AmadeusClient
 from src.core.services import SearchFlightsService
+from src.infra.price_calendar import record_prices
+from src.services.agent_jobs import make_agent_jobs
+from src.services.multi_city import MultiCityPlanner
+from src.services.price_calendar import PriceCalendarService
+from src.services.watches import WatchScheduler, WatchStore
+from src.utils.deadline import Deadline
+from src.core.exceptions import ValidationError
+from src.services.option_views import OptionFormat, negotiate, parse_fields
+from src.infra.fx import FxRefresher
 from src.providers.travelpayouts_client import TravelpayoutsClient
 from src.providers.travelpayouts_provider import TravelpayoutsProvider
 
+MAX_DEADLINE_MS = 120_000
+
 
 @lru_cache(maxsize=1)
 def get_amadeus_client() -> AmadeusClient:
@@ -12,7 +25,8 @@ def get_amadeus_client() -> AmadeusClient:
     return AmadeusClient(
         client_id=settings.amadeus_client_id,
         client_secret=settings.amadeus_client_secret,
-        currency="USD",
+        # results are cached in one currency and converted per response
+        currency=settings.base_currency,
     )
 
 
@@ -22,7 +36,7 @@ def get_travelpayouts_client() -> TravelpayoutsClient:
     return TravelpayoutsClient(
         token=s.travelpayouts_api_token,
         partner_id=s.travelpayouts_partner_id,
-        currency="USD",
+        currency=s.base_currency,
     )
 
 
@@ -44,4 +58,77 @@ def get_flight_provider():
 
 @lru_cache(maxsize=1)
 def get_search_service() -> SearchFlightsService:
-    return SearchFlightsService(provider=get_flight_provider())
+    return SearchFlightsService(provider=get_flight_provider(),
+                                on_results=[record_prices])
+
+
+@lru_cache(maxsize=1)
+def get_price_calendar_service() -> PriceCalendarService:
+    return PriceCalendarService(search=get_search_service())
+
+
+@lru_cache(maxsize=1)
+def get_multi_city_planner() -> MultiCityPlanner:
+    return MultiCityPlanner(search=get_search_service())
+
+
+@lru_cache(maxsize=1)
+def get_agent_jobs():
+    return make_agent_jobs()
+
+
+def get_deadline(x_request_timeout_ms: int | None = Header(None)) -> Deadline:
+    """Request-scoped deadline from `X-Request-Timeout-Ms`, or the default budget."""
+    ms = x_request_timeout_ms or get_settings().request_deadline_ms
+    return Deadline.after(min(max(ms, 1), MAX_DEADLINE_MS) / 1000)
+
+
+def get_agent_deadline(x_request_timeout_ms: int | None = Header(None)) -> Deadline:
+    ms = x_request_timeout_ms or get_settings().agent_deadline_ms
+    return Deadline.after(min(max(ms, 1), MAX_DEADLINE_MS) / 1000)
+
+
+def get_option_format(fields: str | None = Query(
+        None, description="Comma-separated option fields, e.g. summary or price,outbound.stops"),
+        accept: str | None = Header(None)) -> OptionFormat:
+    """Projection from `fields=` and encoding from `Accept` (JSON, columnar JSON, msgpack)."""
+    media_type = negotiate(accept)
+    if media_type is None:
+        raise HTTPException(status_code=406, detail="Unsupported Accept media type")
+    try:
+        return OptionFormat(fields=parse_fields(fields), media_type=media_type)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@lru_cache(maxsize=1)
+def get_watch_store() -> WatchStore:
+    return WatchStore()
+
+
+@lru_cache(maxsize=1)
+def get_watch_scheduler() -> WatchScheduler:
+    return WatchScheduler(store=get_watch_store(), service=get_search_service())
+
+
+@lru_cache(maxsize=1)
+def get_fx_refresher() -> FxRefresher:
+    return FxRefresher()
+
+
+_agent_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _build_llm_agent():
+    # LangChain and the Groq/Ollama clients are slow to import, so they are
+    # only loaded on first agent use (or by the startup warmup thread).
+    from src.llm.agent import LLMAgent
+    agent = LLMAgent()
+    agent.init_executor()
+    return agent
+
+
+def get_llm_agent():
+    with _agent_lock:
+        return _build_llm_agent()
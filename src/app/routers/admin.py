@@ -0,0 +1,48 @@
+import hmac
+from fastapi import APIRouter, Header, HTTPException
+from typing import Any, Dict
+from redis import exceptions
+from src.config import get_settings
+from src.infra.cache_purge import purge_tags
+from src.schemas.flight import CachePurgeRequest
+from src.utils.logger import get_logger
+
+router = APIRouter()
+log = get_logger()
+settings = get_settings()
+
+
+def _check_token(token: str | None) -> None:
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    if not token or not hmac.compare_digest(token, settings.admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def purge_request_tags(body: CachePurgeRequest) -> list[str]:
+    if body.destination and not body.origin:
+        raise HTTPException(status_code=422, detail="destination needs origin")
+    tags = []
+    if body.provider:
+        tags.append(f"provider:{body.provider.lower()}")
+    if body.origin and body.destination:
+        tags.append(f"route:{body.origin.upper()}-{body.destination.upper()}")
+    elif body.origin:
+        tags.append(f"origin:{body.origin.upper()}")
+    if body.month:
+        tags.append(f"month:{body.month}")
+    if not tags:
+        raise HTTPException(status_code=422, detail="give at least one of provider, origin, month")
+    return tags
+
+
+@router.post("/admin/cache/purge")
+def purge_cache(body: CachePurgeRequest,
+                x_admin_token: str | None = Header(None)) -> Dict[str, Any]:
+    """Evict flights entries matching all given tags, e.g. TLV-PRG in 2026-11."""
+    _check_token(x_admin_token)
+    try:
+        return purge_tags(purge_request_tags(body), dry_run=body.dryRun)
+    except (RuntimeError, exceptions.RedisError) as e:
+        log.error("Cache purge failed: %s", e)
+        raise HTTPException(status_code=503, detail="Cache unavailable")
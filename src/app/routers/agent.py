@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
 from typing import Any, Dict, List
-from src.llm.agent import LLMAgent
+from src.app.deps import get_agent_deadline, get_llm_agent, get_option_format
+from src.services.option_views import OptionFormat, stored_ids
+from src.utils.deadline import deadline_scope
 from src.utils.logger import get_logger
 from src.config import get_settings
 
@@ -19,13 +21,18 @@ class AgentResponse(BaseModel):
     output: str  # natural-language reasoning/summary
 
 
-agent = LLMAgent()
-
-
 @router.post("/agent", response_model=AgentResponse)
-def agent_query(body: AgentRequest) -> AgentResponse:
+def agent_query(body: AgentRequest, agent=Depends(get_llm_agent),
+                deadline=Depends(get_agent_deadline),
+                fmt: OptionFormat = Depends(get_option_format)) -> AgentResponse:
     try:
-        options, output = agent.execute(agent=body.query)
+        # tool calls pick the deadline up from the context
+        with deadline_scope(deadline):
+            options, output = agent.execute(agent=body.query)
+        if not fmt.is_default:
+            return Response(content=fmt.render({"options": options, "output": output},
+                                               stored_ids(options)),
+                            media_type=fmt.media_type, headers={"Vary": "Accept"})
         return AgentResponse(options=options, output=output)
     except ValueError as ve:
         # e.g., date guard past date
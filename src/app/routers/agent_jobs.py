@@ -0,0 +1,87 @@
+import asyncio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from redis import exceptions
+from src.app.deps import get_agent_jobs
+from src.services.agent_jobs import TERMINAL
+from src.utils.logger import get_logger
+from src.config import get_settings
+
+router = APIRouter()
+log = get_logger()
+settings = get_settings()
+
+KEEPALIVE_SEC = 15
+
+
+class AgentJobRequest(BaseModel):
+    query: str
+
+
+class AgentJob(BaseModel):
+    id: str
+    status: str  # queued | running | done | failed
+    options: List[Dict[str, Any]] = []
+    output: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+
+def _get_job(jobs, job_id: str) -> Dict[str, Any]:
+    try:
+        job = jobs.get(job_id)
+    except (RuntimeError, exceptions.RedisError) as e:
+        log.error("Agent job store unavailable: %s", e)
+        raise HTTPException(status_code=503, detail="Job store unavailable")
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/agent/jobs", response_model=AgentJob, status_code=202)
+def create_job(body: AgentJobRequest, jobs=Depends(get_agent_jobs)) -> AgentJob:
+    try:
+        return AgentJob(**jobs.submit(body.query))
+    except (RuntimeError, exceptions.RedisError) as e:
+        log.error("Agent job queue unavailable: %s", e)
+        raise HTTPException(status_code=503, detail="Job queue unavailable")
+
+
+@router.get("/agent/jobs/{job_id}", response_model=AgentJob)
+def get_job(job_id: str, jobs=Depends(get_agent_jobs)) -> AgentJob:
+    return AgentJob(**_get_job(jobs, job_id))
+
+
+@router.get("/agent/jobs/{job_id}/events")
+async def job_events(job_id: str, jobs=Depends(get_agent_jobs)) -> StreamingResponse:
+    """Server-sent events: one event per status change, ending with done/failed."""
+    await run_in_threadpool(_get_job, jobs, job_id)  # 404 before streaming
+
+    async def stream():
+        last_status, idle = None, 0.0
+        while True:
+            try:
+                job = await run_in_threadpool(_get_job, jobs, job_id)
+            except HTTPException as e:
+                yield f"event: error\ndata: {orjson.dumps({'detail': e.detail}).decode()}\n\n"
+                return
+            if job["status"] != last_status:
+                last_status, idle = job["status"], 0.0
+                job.pop("query", None)
+                yield f"event: {last_status}\ndata: {orjson.dumps(job).decode()}\n\n"
+                if last_status in TERMINAL:
+                    return
+            elif idle >= KEEPALIVE_SEC:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            await asyncio.sleep(settings.agent_job_poll_sec)
+            idle += settings.agent_job_poll_sec
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache",
+                                      "X-Accel-Buffering": "no"})
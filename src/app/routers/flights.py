@@ -1,7 +1,21 @@
-from fastapi import APIRouter, HTTPException, Depends
-from src.app.deps import get_amadeus_client, get_search_service
-from src.schemas.flight import FlightRequest, FlightResponse
-from src.infra.cache import cache_get, cache_set, make_key
+import orjson
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from src.app.deps import (
+    get_deadline, get_multi_city_planner, get_option_format, get_search_service,
+)
+from src.core.exceptions import DomainError
+from src.schemas.flight import (
+    FlightBatchRequest, FlightBatchResponse, FlightOption, FlightRequest, FlightResponse,
+    MultiCityRequest, MultiCityResponse,
+)
+from src.services.batch_search import search_batch_async
+from src.services.nearby import search_nearby
+from src.services.option_views import OptionFormat, option_details
+from src.services.result_views import load_entry_async, page_etag, render_page
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.http_cache import cached_response, make_etag
 from src.utils.logger import get_logger
 from src.config import get_settings
 
@@ -10,22 +24,88 @@ log = get_logger()
 settings = get_settings()
 
 
-@router.post("/flights", response_model=FlightResponse)
-def search_flights(req: FlightRequest,
-                   provider=Depends(get_amadeus_client),
-                   flight_service=Depends(get_search_service)) -> FlightResponse:
-    key = make_key(provider, req)
-    cached = cache_get(key)
-    if cached is not None:
-        log.info("Cache hit for %s", key)
-        return FlightResponse(**cached)
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _upstream_error(e: Exception, deadline: Deadline) -> HTTPException:
+    if isinstance(e, DeadlineExceeded) or deadline.expired():
+        log.warning("Deadline exceeded: %s", e)
+        return HTTPException(status_code=504, detail="Search deadline exceeded")
+    log.error("Provider error: %s", e)
+    return HTTPException(status_code=502, detail="Upstream search failed")
 
+
+async def _search(req: FlightRequest, request: Request, flight_service,
+                  deadline: Deadline, fmt: OptionFormat) -> Response:
     try:
-        options = flight_service.execute(req)
+        if req.nearbyRadiusKm:
+            body = await run_in_threadpool(search_nearby, flight_service, req, deadline, fmt)
+            return cached_response(request, make_etag(body), lambda: body, fmt.media_type)
+        # sorting and paging are cut from the cached full result set; hits
+        # are served on the event loop, only misses use a thread
+        key, entry = await load_entry_async(flight_service, req, deadline)
+        # a repeat of a page the client holds is a 304 (GET), a repeat from
+        # another client reuses the compressed bytes; only new variants are rendered
+        return cached_response(request, page_etag(entry, req, key, fmt),
+                               lambda: render_page(entry, req, key, fmt), fmt.media_type)
+    except DomainError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
-        log.error("Provider error: %s", e)
-        raise HTTPException(status_code=502, detail="Upstream search failed")
+        raise _upstream_error(e, deadline)
+
+
+@router.get("/flights", response_model=FlightResponse)
+async def get_flights(req: Annotated[FlightRequest, Query()], request: Request,
+                      flight_service=Depends(get_search_service),
+                      deadline: Deadline = Depends(get_deadline),
+                      fmt: OptionFormat = Depends(get_option_format)) -> Response:
+    """The search as a cacheable GET: pages carry an ETag and revalidate to 304."""
+    return await _search(req, request, flight_service, deadline, fmt)
+
+
+@router.post("/flights", response_model=FlightResponse)
+async def search_flights(req: FlightRequest, request: Request,
+                         flight_service=Depends(get_search_service),
+                         deadline: Deadline = Depends(get_deadline),
+                         fmt: OptionFormat = Depends(get_option_format)) -> Response:
+    return await _search(req, request, flight_service, deadline, fmt)
 
-    result = FlightResponse(options=options).model_dump()
-    cache_set(key, result)
-    return FlightResponse(**result)
+
+@router.post("/flights/batch", response_model=FlightBatchResponse)
+async def search_flights_batch(body: FlightBatchRequest,
+                               flight_service=Depends(get_search_service),
+                               deadline: Deadline = Depends(get_deadline)) -> Response:
+    if len(body.requests) > settings.batch_max_items:
+        raise HTTPException(status_code=422,
+                            detail=f"at most {settings.batch_max_items} requests per batch")
+    # per-item failures are reported inside the response
+    return _json_response(await search_batch_async(flight_service, body.requests, deadline))
+
+
+@router.get("/flights/options/{option_id}", response_model=FlightOption)
+def get_flight_option(option_id: str, currency: Optional[str] = None) -> Response:
+    """Full details of an option listed with `fields=` or a compact encoding."""
+    try:
+        option = option_details(option_id, currency)
+    except DomainError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if option is None:
+        raise HTTPException(status_code=404, detail="Option expired, search again")
+    return _json_response(orjson.dumps(option))
+
+
+@router.post("/flights/multi-city", response_model=MultiCityResponse)
+def search_multi_city(req: MultiCityRequest,
+                      planner=Depends(get_multi_city_planner),
+                      deadline: Deadline = Depends(get_deadline)) -> MultiCityResponse:
+    try:
+        return MultiCityResponse(**planner.plan(req, deadline))
+    except (DomainError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise _upstream_error(e, deadline)
@@ -1,10 +1,33 @@
-from fastapi import APIRouter, Query
-from typing import List, Dict, Any
-from src.infra.airports.airports_loader import search_airports
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Optional
+from src.config import get_settings
+from src.infra.airports import airports_loader
+from src.infra.airports.airports_loader import is_prefix_query, search_airports_json
+from src.utils.http_cache import cached_response, make_etag
 
 router = APIRouter()
+settings = get_settings()
 
+# a URL carrying the dataset version never changes meaning
+IMMUTABLE = "public, max-age=31536000, immutable"
 
-@router.get("/locations")
-def locations(q: str = Query(..., min_length=2)) -> List[Dict[str, Any]]:
-    return search_airports(q)
+
+@router.get("/locations", response_model=List[Dict[str, Any]])
+async def locations(request: Request, q: str = Query(..., min_length=2),
+                    v: Optional[str] = Query(None, description="Dataset version (X-Dataset-Version)")
+                    ) -> Response:
+    version = airports_loader.DATASET_VERSION
+    cache_control = IMMUTABLE if v and v == version \
+        else f"public, max-age={settings.locations_max_age_sec}"
+
+    def respond() -> Response:
+        return cached_response(request, make_etag(version.encode(), q.lower().encode()),
+                               lambda: search_airports_json(q), "application/json",
+                               cache_control=cache_control,
+                               headers={"X-Dataset-Version": version})
+
+    # 2-3 characters (most keystrokes) are a dict lookup; longer queries scan
+    if is_prefix_query(q):
+        return respond()
+    return await run_in_threadpool(respond)
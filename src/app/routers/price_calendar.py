@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from src.app.deps import get_deadline, get_price_calendar_service
+from src.core.exceptions import DomainError
+from src.services.price_calendar import resolve_range
+from src.schemas.flight import PriceCalendarResponse
+
+router = APIRouter()
+
+
+@router.get("/price-calendar", response_model=PriceCalendarResponse)
+def price_calendar(origin: str = Query(..., min_length=3, max_length=3),
+                   destination: str = Query(..., min_length=3, max_length=3),
+                   month: Optional[str] = Query(None, description="YYYY-MM"),
+                   dateFrom: Optional[date] = None,
+                   dateTo: Optional[date] = None,
+                   tripDays: Optional[int] = Query(
+                       None, ge=1, le=60, description="Round trip length; omit for one-way"),
+                   fill: bool = Query(
+                       True, description="Query upstream for days with no fresh price"),
+                   currency: Optional[str] = Query(None, min_length=3, max_length=3),
+                   service=Depends(get_price_calendar_service),
+                   deadline=Depends(get_deadline)) -> PriceCalendarResponse:
+    try:
+        start, end = resolve_range(month, dateFrom, dateTo)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    try:
+        result = service.lookup(origin, destination, start, end, trip_days=tripDays,
+                                fill=fill, deadline=deadline, currency=currency)
+    except DomainError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return PriceCalendarResponse(**result)
@@ -0,0 +1,95 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Any, Dict, List
+from redis import exceptions
+from src.app.deps import get_search_service, get_watch_store
+from src.core.entities import Airport
+from src.core.exceptions import DomainError
+from src.infra.fx import check_currency, convert
+from src.schemas.flight import Watch, WatchCreate
+from src.utils.date_guard import coerce_future_iso
+from src.utils.logger import get_logger
+
+router = APIRouter()
+log = get_logger()
+
+
+def _unavailable(e: Exception) -> HTTPException:
+    log.error("Watch store unavailable: %s", e)
+    return HTTPException(status_code=503, detail="Watch store unavailable")
+
+
+def _in_currency(amount, from_currency, watch: Dict[str, Any]):
+    # snapshots are kept in the base currency, watches show their own
+    if amount is None or not from_currency:
+        return amount
+    return convert(amount, from_currency, watch.get("currency") or from_currency)
+
+
+def _drop_view(drop: Dict[str, Any], watch: Dict[str, Any]) -> Dict[str, Any]:
+    cur = drop.get("currency")
+    return {**drop,
+            "old_min_price": _in_currency(drop["old_min_price"], cur, watch),
+            "new_min_price": _in_currency(drop["new_min_price"], cur, watch),
+            "currency": watch.get("currency") or cur}
+
+
+def _view(store, watch: Dict[str, Any], with_drops: bool = False) -> Watch:
+    snap = store.snapshot(watch["group"]) or {}
+    min_price = _in_currency(snap.get("min_price"), snap.get("currency"), watch)
+    return Watch(
+        **watch,
+        min_price=min_price,
+        polled_at=snap.get("polled_at"),
+        below_max_price=(min_price <= watch["maxPrice"]
+                         if min_price is not None and watch.get("maxPrice") else None),
+        drops=[_drop_view(d, watch) for d in store.drops(watch["group"])] if with_drops else [],
+    )
+
+
+@router.post("/watches", response_model=Watch, status_code=201)
+def create_watch(body: WatchCreate, store=Depends(get_watch_store),
+                 service=Depends(get_search_service)) -> Watch:
+    try:
+        Airport(body.origin), Airport(body.destination)
+        fields = body.model_dump()
+        fields["origin"], fields["destination"] = body.origin.upper(), body.destination.upper()
+        fields["currency"] = check_currency(body.currency or "USD")
+        fields["departureDate"] = coerce_future_iso(body.departureDate).isoformat()
+        if body.returnDate:
+            fields["returnDate"] = coerce_future_iso(body.returnDate).isoformat()
+    except (DomainError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    try:
+        return _view(store, store.create(fields, service.provider))
+    except (RuntimeError, exceptions.RedisError) as e:
+        raise _unavailable(e)
+
+
+@router.get("/watches", response_model=List[Watch])
+def list_watches(store=Depends(get_watch_store)) -> List[Watch]:
+    try:
+        return [_view(store, w) for w in store.list()]
+    except (RuntimeError, exceptions.RedisError) as e:
+        raise _unavailable(e)
+
+
+@router.get("/watches/{watch_id}", response_model=Watch)
+def get_watch(watch_id: str, store=Depends(get_watch_store)) -> Watch:
+    try:
+        watch = store.get(watch_id)
+        if watch is None:
+            raise HTTPException(status_code=404, detail="Watch not found")
+        return _view(store, watch, with_drops=True)
+    except (RuntimeError, exceptions.RedisError) as e:
+        raise _unavailable(e)
+
+
+@router.delete("/watches/{watch_id}", status_code=204)
+def delete_watch(watch_id: str, store=Depends(get_watch_store)) -> Response:
+    try:
+        if not store.delete(watch_id):
+            raise HTTPException(status_code=404, detail="Watch not found")
+    except (RuntimeError, exceptions.RedisError) as e:
+        raise _unavailable(e)
+    return Response(status_code=204)
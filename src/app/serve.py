@@ -0,0 +1,75 @@
+"""
+Pre-fork multi-worker launcher (gunicorn master + uvicorn workers).
+
+The app and the airport data (list + spatial index) are loaded once in the
+master, then gc.freeze() moves them to a permanent generation so the
+collector never writes to their headers. Workers therefore keep sharing
+those pages copy-on-write instead of each holding a private copy.
+
+    python -m src.app.serve --workers 4 --port 8000
+
+Each worker logs its unique memory (USS) after boot; GET /health/memory
+reports it at runtime. More than one worker needs AGENT_JOBS_MODE=redis:
+local agent jobs live in the memory of the worker that accepted them.
+"""
+import argparse
+import gc
+import multiprocessing
+from gunicorn.app.base import BaseApplication
+from src.config import get_settings
+from src.utils.logger import get_logger
+from src.utils.memory import process_memory
+
+log = get_logger("serve")
+
+
+def _post_worker_init(worker):
+    mem = process_memory()
+    log.info("[Worker %s] booted: uss=%s kB pss=%s kB rss=%s kB",
+             worker.pid, mem.get("uss_kb"), mem.get("pss_kb"), mem.get("rss_kb"))
+
+
+class PreforkApplication(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        # runs once in the master because of preload_app
+        from src.app.app import app
+        from src.infra.airports.airports_loader import load_airports
+        load_airports()
+        gc.collect()
+        gc.freeze()
+        mem = process_memory()
+        log.info("[Master] data loaded and frozen: rss=%s kB", mem.get("rss_kb"))
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int,
+                        default=max(2, multiprocessing.cpu_count()))
+    args = parser.parse_args()
+    if args.workers > 1 and get_settings().agent_jobs_mode != "redis":
+        # a job's status/events requests may land on a worker that never saw it
+        parser.error("--workers > 1 needs AGENT_JOBS_MODE=redis "
+                     "(and `python -m src.workers.agent_worker` running)")
+
+    PreforkApplication({
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "post_worker_init": _post_worker_init,
+    }).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,84 @@ class Settings:
     amadeus_client_secret: str | None = os.getenv("AMADEUS_CLIENT_SECRET")
     amadeus_auth_url: str | None = os.getenv("AMADEUS_AUTH_URL")
     amadeus_flights_url: str | None = os.getenv("AMADEUS_FLIGHTS_URL")
+    amadeus_token_refresh_margin_sec: int = int(
+        os.getenv("AMADEUS_TOKEN_REFRESH_MARGIN_SEC", "120"))
+    amadeus_token_check_sec: float = float(
+        os.getenv("AMADEUS_TOKEN_CHECK_SEC", "30"))
+    amadeus_token_lock_sec: int = int(os.getenv("AMADEUS_TOKEN_LOCK_SEC", "10"))
 
     model_name: str | None = os.getenv("MODEL_NAME")
     groq_api_key: str | None = os.getenv("GROQ_API_KEY")
+    # non-search messages: rules | ollama (small local classifier) | off
+    intent_router: str = os.getenv("INTENT_ROUTER", "rules")
+    intent_model_name: str = os.getenv("INTENT_MODEL_NAME", "qwen2.5:0.5b")
+    small_model_name: str | None = os.getenv("SMALL_MODEL_NAME")
     use_verbose: bool = os.getenv("USE_VERBOSE", 'false') == 'true'
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    redis_required: bool = os.getenv("REDIS_REQUIRED", 'false') == 'true'
+    redis_connect_timeout_sec: float = float(
+        os.getenv("REDIS_CONNECT_TIMEOUT_SEC", "1"))
+    redis_retry_sec: float = float(os.getenv("REDIS_RETRY_SEC", "30"))
+    redis_cluster: bool = os.getenv("REDIS_CLUSTER", 'false') == 'true'
+    redis_pool_size: int = int(os.getenv("REDIS_POOL_SIZE", "50"))
+    redis_socket_timeout_sec: float = float(
+        os.getenv("REDIS_SOCKET_TIMEOUT_SEC", "0.5"))
+    redis_retries: int = int(os.getenv("REDIS_RETRIES", "1"))
+    redis_retry_backoff_ms: int = int(os.getenv("REDIS_RETRY_BACKOFF_MS", "20"))
+    # async cache reads past this are served as misses
+    cache_timeout_ms: int = int(os.getenv("CACHE_TIMEOUT_MS", "150"))
+    price_calendar_fresh_sec: int = int(
+        os.getenv("PRICE_CALENDAR_FRESH_SEC", "21600"))
+    price_calendar_retention_sec: int = int(
+        os.getenv("PRICE_CALENDAR_RETENTION_SEC", str(30 * 24 * 3600)))
+    price_calendar_max_fill: int = int(
+        os.getenv("PRICE_CALENDAR_MAX_FILL", "31"))
+    price_calendar_concurrency: int = int(
+        os.getenv("PRICE_CALENDAR_CONCURRENCY", "6"))
+    multi_city_concurrency: int = int(
+        os.getenv("MULTI_CITY_CONCURRENCY", "6"))
+    nearby_max_airports: int = int(os.getenv("NEARBY_MAX_AIRPORTS", "3"))
+    nearby_concurrency: int = int(os.getenv("NEARBY_CONCURRENCY", "8"))
+    agent_jobs_mode: str = os.getenv("AGENT_JOBS_MODE", "local")  # local | redis
+    agent_workers: int = int(os.getenv("AGENT_WORKERS", "2"))
+    agent_job_ttl_sec: int = int(os.getenv("AGENT_JOB_TTL_SEC", "3600"))
+    agent_job_poll_sec: float = float(os.getenv("AGENT_JOB_POLL_SEC", "0.5"))
+    # a claimed job whose worker stops renewing this lease is re-queued
+    agent_job_lease_sec: int = int(os.getenv("AGENT_JOB_LEASE_SEC", "60"))
+    agent_job_max_attempts: int = int(os.getenv("AGENT_JOB_MAX_ATTEMPTS", "2"))
+    watch_scheduler: bool = os.getenv("WATCH_SCHEDULER", 'true') == 'true'
+    watch_interval_sec: int = int(os.getenv("WATCH_INTERVAL_SEC", "3600"))
+    watch_tick_sec: float = float(os.getenv("WATCH_TICK_SEC", "30"))
+    watch_max_polls_per_tick: int = int(
+        os.getenv("WATCH_MAX_POLLS_PER_TICK", "10"))
+    request_deadline_ms: int = int(os.getenv("REQUEST_DEADLINE_MS", "15000"))
+    agent_deadline_ms: int = int(os.getenv("AGENT_DEADLINE_MS", "60000"))
+    hedge_requests: bool = os.getenv("HEDGE_REQUESTS", 'false') == 'true'
+    hedge_min_delay_ms: int = int(os.getenv("HEDGE_MIN_DELAY_MS", "300"))
+    agent_tool_concurrency: int = int(os.getenv("AGENT_TOOL_CONCURRENCY", "4"))
+    # estimated tokens of tool results / chat history sent back to the model
+    agent_observation_tokens: int = int(os.getenv("AGENT_OBSERVATION_TOKENS", "600"))
+    agent_scratchpad_tokens: int = int(os.getenv("AGENT_SCRATCHPAD_TOKENS", "2000"))
+    agent_history_tokens: int = int(os.getenv("AGENT_HISTORY_TOKENS", "1000"))
+    agent_warmup: bool = os.getenv("AGENT_WARMUP", 'true') == 'true'
+    base_currency: str = os.getenv("BASE_CURRENCY", "USD").upper()
+    fx_rates_url: str = os.getenv(
+        "FX_RATES_URL", "https://open.er-api.com/v6/latest/{base}")
+    fx_refresh_sec: int = int(os.getenv("FX_REFRESH_SEC", "21600"))  # 0: static only
     ttl_sec: int = int(os.getenv("FLIGHT_CACHE_TTL_SEC", "1800"))
+    # per-entry TTL from days to departure and price history, within bounds
+    adaptive_ttl: bool = os.getenv("ADAPTIVE_TTL", 'true') == 'true'
+    cache_ttl_min_sec: int = int(os.getenv("CACHE_TTL_MIN_SEC", "300"))
+    cache_ttl_max_sec: int = int(os.getenv("CACHE_TTL_MAX_SEC", "86400"))
+    batch_max_items: int = int(os.getenv("BATCH_MAX_ITEMS", "25"))
+    batch_concurrency: int = int(os.getenv("BATCH_CONCURRENCY", "6"))
+    admin_token: str | None = os.getenv("ADMIN_TOKEN")  # unset: admin API off
+    result_set_size: int = int(os.getenv("RESULT_SET_SIZE", "50"))
+    # encoded response bodies kept per process, by ETag
+    response_cache_items: int = int(os.getenv("RESPONSE_CACHE_ITEMS", "2048"))
+    compress_min_bytes: int = int(os.getenv("COMPRESS_MIN_BYTES", "512"))
+    # browser cache for /api/locations without ?v=<dataset version>
+    locations_max_age_sec: int = int(os.getenv("LOCATIONS_MAX_AGE_SEC", "86400"))
 
     travelpayouts_api_token: str | None = os.getenv("TRAVELPAYOUTS_API_TOKEN")
     travelpayouts_partner_id: str | None = os.getenv(
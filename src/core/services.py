@@ -1,23 +1,57 @@
-from dataclasses import dataclass
-from typing import Protocol, List
+from dataclasses import dataclass, field
+from typing import Callable, Protocol, List
 from .entities import FlightQuery, Itinerary
+from src.config import get_settings
 from src.schemas.flight import FlightRequest
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.hedging import LatencyTracker, hedged_call, timed
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+# upstream latency per provider, feeds the hedge delay
+provider_latency = LatencyTracker()
 
 
 class FlightProvider(Protocol):
-    def search(self, query: FlightQuery,
-               limit: int = 10) -> List[Itinerary]: ...
+    def search(self, query: FlightQuery, limit: int = 10,
+               deadline: Deadline | None = None) -> List[Itinerary]: ...
 
 
 @dataclass
 class SearchFlightsService:
     provider: FlightProvider
+    # called with every provider result, e.g. to feed the price calendar
+    on_results: List[Callable[[list], None]] = field(default_factory=list)
 
-    def execute(self, query_or_req: FlightQuery | FlightRequest, limit: int = 10) -> List[Itinerary]:
+    def _hedge_delay(self, name: str) -> float | None:
+        if not settings.hedge_requests:
+            return None
+        p95 = provider_latency.percentile(name)
+        if p95 is None:
+            return None  # not enough samples yet
+        return max(p95, settings.hedge_min_delay_ms / 1000)
+
+    def execute(self, query_or_req: FlightQuery | FlightRequest, limit: int = 10,
+                deadline: Deadline | None = None) -> List[Itinerary]:
         if isinstance(query_or_req, FlightRequest):
             from src.utils.flights import init_flight_query
             query = init_flight_query(query_or_req)
         else:
             query = query_or_req
 
-        return self.provider.search(query, limit=limit)
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceeded("request deadline exceeded")
+
+        name = self.provider.__class__.__name__
+        call = timed(provider_latency, name,
+                     lambda: self.provider.search(query, limit=limit, deadline=deadline))
+        delay = self._hedge_delay(name)
+        results = call() if delay is None else hedged_call(call, delay, deadline)
+        for hook in self.on_results:
+            try:
+                hook(results)
+            except Exception as e:
+                log.warning("Result hook %s failed: %s", hook.__name__, e)
+        return results
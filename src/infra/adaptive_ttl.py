@@ -0,0 +1,94 @@
+import time
+import orjson
+from datetime import date
+from typing import List, Optional, Tuple
+from redis import exceptions
+from src.config import get_settings
+from src.infra.cache import get_redis
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+HISTORY_KEY = "ttlhist:v1:{}"     # recent (fetched_at, min_price) per flights key
+HISTORY_LEN = 5
+HISTORY_TTL_SEC = 14 * 24 * 3600
+
+# (max days to departure, multiple of FLIGHT_CACHE_TTL_SEC)
+DEPARTURE_TTL_STEPS = [(2, 1 / 3), (7, 1), (30, 2), (90, 8)]
+FAR_OUT_MULTIPLE = 24
+# relative price change between fetches that keeps the departure-based TTL
+REFERENCE_CHANGE = 0.05
+
+
+def departure_ttl(days_out: Optional[int]) -> float:
+    if days_out is None:
+        return settings.ttl_sec
+    for max_days, multiple in DEPARTURE_TTL_STEPS:
+        if days_out <= max_days:
+            return settings.ttl_sec * multiple
+    return settings.ttl_sec * FAR_OUT_MULTIPLE
+
+
+def volatility_factor(history: List[Tuple[float, int]]) -> float:
+    """
+    Below 1 when the cheapest price moved a lot between successive fetches,
+    above 1 when it held steady; 1 without history. Clamped to [0.25, 2].
+    """
+    prices = [p for _, p in history if p]
+    if len(prices) < 2:
+        return 1.0
+    change = max(abs(a - b) / b for a, b in zip(prices, prices[1:]))
+    return min(2.0, max(0.25, REFERENCE_CHANGE / max(change, REFERENCE_CHANGE / 8)))
+
+
+def _min_price(body: bytes) -> Optional[int]:
+    options = orjson.loads(body).get("options") or []
+    return min((o["price"]["amount"] for o in options), default=None)
+
+
+def _history_key(key: str) -> str:
+    return HISTORY_KEY.format(key.rsplit(":", 1)[-1])
+
+
+def entry_ttls(entries: List[Tuple[str, Optional[date], bytes]]) -> List[int]:
+    """
+    TTL for each new cache entry `(key, departure, body)`, from days to
+    departure and the key's recent price history, within
+    `cache_ttl_min_sec` / `cache_ttl_max_sec`. Also appends this fetch to
+    each key's history (one pipeline to read, one to write).
+    """
+    if not settings.adaptive_ttl:
+        return [settings.ttl_sec] * len(entries)
+
+    histories: List[List[Tuple[float, int]]] = [[] for _ in entries]
+    now = time.time()
+    prices = [_min_price(body) for _, _, body in entries]
+    redis = get_redis()
+    if redis is not None:
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, _, _ in entries:
+                pipe.lrange(_history_key(key), 0, HISTORY_LEN - 2)
+            past = pipe.execute()
+            pipe = redis.pipeline(transaction=False)
+            for (key, _, _), price, prev in zip(entries, prices, past):
+                if price is None:
+                    continue
+                hkey = _history_key(key)
+                pipe.lpush(hkey, orjson.dumps([now, price]))
+                pipe.ltrim(hkey, 0, HISTORY_LEN - 1)
+                pipe.expire(hkey, HISTORY_TTL_SEC)
+            pipe.execute()
+            histories = [[tuple(orjson.loads(p)) for p in prev] for prev in past]
+        except exceptions.RedisError as e:
+            log.warning("[Cache] Price history unavailable: %s", e)
+
+    today = date.today()
+    ttls = []
+    for (key, departure, _), price, history in zip(entries, prices, histories):
+        days_out = (departure - today).days if departure else None
+        # newest first, matching the stored list
+        ttl = departure_ttl(days_out) * volatility_factor([(now, price)] + history)
+        ttls.append(int(min(settings.cache_ttl_max_sec, max(settings.cache_ttl_min_sec, ttl))))
+    return ttls
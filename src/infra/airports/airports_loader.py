@@ -1,8 +1,17 @@
+import hashlib
 import json
+import orjson
 from pathlib import Path
 from pydantic import BaseModel
+from .geo_index import GeoIndex
 
 AIRPORTS = []
+GEO_INDEX = GeoIndex()
+DATASET_VERSION = ""
+# ready-to-send search_airports() bytes for every 2-3 character query
+PREFIX_LENGTHS = (2, 3)
+PREFIX_RESPONSES: dict[str, bytes] = {}
+SEARCH_LIMIT = 10
 
 
 class Airport(BaseModel):
@@ -14,11 +23,13 @@ class Airport(BaseModel):
     country: str
 
 
-def load_airports():
-    global AIRPORTS
+def load_airports(force: bool = False):
+    global AIRPORTS, GEO_INDEX, DATASET_VERSION, PREFIX_RESPONSES
+    if AIRPORTS and not force:
+        return  # already loaded, e.g. by the pre-fork master
     path = Path(__file__).parent / "airports.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    raw = path.read_bytes()
+    data = json.loads(raw)
 
     # the file is keyed by ICAO, so loop values
     AIRPORTS = [
@@ -33,6 +44,29 @@ def load_airports():
         if a.get("iata")  # skip entries with no IATA
     ]
 
+    geo = GeoIndex()
+    for a in data.values():
+        if a.get("iata") and a.get("lat") is not None and a.get("lon") is not None:
+            geo.add(a["iata"].upper(), float(a["lat"]), float(a["lon"]))
+    GEO_INDEX = geo
+    PREFIX_RESPONSES = _prefix_responses(AIRPORTS)
+    DATASET_VERSION = hashlib.sha256(raw).hexdigest()[:12]
+
+
+def _prefix_responses(airports: list[dict]) -> dict[str, bytes]:
+    """Same results as search_airports() for each short prefix, serialized once."""
+    matches: dict[str, list[dict]] = {}
+    for a in airports:
+        prefixes = {field.lower()[:n]
+                    for field in (a["iata"], a["city"], a["name"]) if field
+                    for n in PREFIX_LENGTHS if len(field.lower()) >= n}
+        for prefix in prefixes:
+            found = matches.setdefault(prefix, [])
+            if len(found) < SEARCH_LIMIT:
+                found.append(a)  # in dataset order, like the scan
+    return {p: orjson.dumps([add_airport_label(a) for a in found])
+            for p, found in matches.items()}
+
 
 def add_airport_label(airport):
     return {
@@ -41,7 +75,7 @@ def add_airport_label(airport):
     }
 
 
-def search_airports(query: str, limit: int = 10) -> list[Airport]:
+def search_airports(query: str, limit: int = SEARCH_LIMIT) -> list[Airport]:
     q = query.lower()
     results = [
         add_airport_label(a) for a in AIRPORTS
@@ -50,3 +84,27 @@ def search_airports(query: str, limit: int = 10) -> list[Airport]:
         or (a["name"] and a["name"].lower().startswith(q))
     ]
     return results[:limit]
+
+
+def nearby_airports(iata: str, radius_km: float, limit: int = 3) -> list[str]:
+    """
+    IATA codes within `radius_km` of `iata`, the airport itself first,
+    followed by up to `limit` neighbours (nearest first).
+    """
+    code = iata.upper()
+    coords = GEO_INDEX.coords(code)
+    if coords is None:
+        return [code]
+    neighbours = [c for c, _ in GEO_INDEX.within(*coords, radius_km) if c != code]
+    return [code] + neighbours[:limit]
+
+
+def is_prefix_query(query: str) -> bool:
+    return len(query.lower()) in PREFIX_LENGTHS
+
+
+def search_airports_json(query: str) -> bytes:
+    """search_airports() as response bytes; short queries are a table lookup."""
+    if is_prefix_query(query):
+        return PREFIX_RESPONSES.get(query.lower(), b"[]")
+    return orjson.dumps(search_airports(query))
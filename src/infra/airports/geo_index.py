@@ -0,0 +1,65 @@
+import math
+from collections import defaultdict
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = 111.2
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class GeoIndex:
+    """
+    Fixed-size lat/lon grid buckets (1 degree cells by default).
+    A radius query only scans the handful of cells that overlap the search
+    circle, so it stays cheap enough to run on every request.
+    """
+
+    def __init__(self, cell_deg: float = 1.0):
+        self.cell_deg = cell_deg
+        self._cells: dict[tuple[int, int], list[tuple[str, float, float]]] = defaultdict(list)
+        self._coords: dict[str, tuple[float, float]] = {}
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return int(math.floor(lat / self.cell_deg)), int(math.floor(lon / self.cell_deg))
+
+    def add(self, code: str, lat: float, lon: float) -> None:
+        self._coords[code] = (lat, lon)
+        self._cells[self._cell(lat, lon)].append((code, lat, lon))
+
+    def coords(self, code: str) -> tuple[float, float] | None:
+        return self._coords.get(code)
+
+    def __len__(self) -> int:
+        return len(self._coords)
+
+    def within(self, lat: float, lon: float, radius_km: float) -> list[tuple[str, float]]:
+        """(code, distance_km) of every point within `radius_km`, nearest first."""
+        dlat = radius_km / KM_PER_DEG_LAT
+        # longitude degrees shrink towards the poles
+        cos_lat = max(math.cos(math.radians(lat)), 0.01)
+        dlon = min(radius_km / (KM_PER_DEG_LAT * cos_lat), 180.0)
+
+        lat0, lon0 = self._cell(lat - dlat, lon - dlon)
+        lat1, lon1 = self._cell(lat + dlat, lon + dlon)
+        lon_cells = round(360 / self.cell_deg)
+
+        seen = set()
+        hits = []
+        for cx in range(lat0, lat1 + 1):
+            for cy in range(lon0, lon1 + 1):
+                # wrap around the antimeridian
+                wrapped = (cy + lon_cells // 2) % lon_cells - lon_cells // 2
+                if (cx, wrapped) in seen:
+                    continue
+                seen.add((cx, wrapped))
+                for code, plat, plon in self._cells.get((cx, wrapped), ()):
+                    d = haversine_km(lat, lon, plat, plon)
+                    if d <= radius_km:
+                        hits.append((code, d))
+        hits.sort(key=lambda t: t[1])
+        return hits
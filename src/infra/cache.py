@@ -1,28 +1,70 @@
 import hashlib
 import orjson
+import threading
 import time
+import zlib
 from datetime import timedelta
-from redis import Redis, exceptions
+from redis import Redis, RedisCluster, exceptions
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
 from src.config import get_settings
+from src.infra.fx import to_base
 from src.schemas.flight import FlightRequest
+from src.utils.date_guard import coerce_future_iso
 from src.utils.logger import get_logger
 
 settings = get_settings()
 log = get_logger()
 
 
+def client_options() -> dict:
+    """Pool, timeout and retry settings shared by the sync and async clients."""
+    return {
+        "decode_responses": False,
+        "max_connections": settings.redis_pool_size,
+        "socket_connect_timeout": settings.redis_connect_timeout_sec,
+        "socket_timeout": settings.redis_socket_timeout_sec,
+        "health_check_interval": 30,
+    }
+
+
+def new_redis_client(blocking: bool = False) -> Redis | RedisCluster:
+    """
+    A client for `redis_url` (a cluster client with REDIS_CLUSTER=true).
+    `blocking` drops the socket timeout, for commands like BRPOP.
+    """
+    opts = client_options()
+    if blocking:
+        opts["socket_timeout"] = None
+    retry = Retry(ExponentialBackoff(cap=settings.redis_retry_backoff_ms / 1000 * 8,
+                                     base=settings.redis_retry_backoff_ms / 1000),
+                  settings.redis_retries)
+    if settings.redis_cluster:
+        return RedisCluster.from_url(settings.redis_url, retry=retry, **opts)
+    return Redis.from_url(settings.redis_url, retry=retry, **opts)
+
+
+def hash_tag(value: str) -> str:
+    """
+    `{value}` under Redis Cluster, so keys sharing it land in one slot
+    (an entry and its price history, a watch group's keys, all tag sets).
+    """
+    return f"{{{value}}}" if settings.redis_cluster else value
+
+
 def _connect_redis(required: bool = True, retries: int = 5, delay: float = 0.8):
     url = settings.redis_url
 
     for i in range(1, retries+1):
         try:
-            redis = Redis.from_url(url, decode_responses=False)
+            redis = new_redis_client()
             redis.ping()
             log.info(f"[Redis] Connected OK: {url}")
             return redis
-        except exceptions.ConnectionError as e:
+        except (exceptions.RedisError, exceptions.RedisClusterException) as e:
             log.warning(f"[Redis] Attempt {i}/{retries} failed: {e}")
-            time.sleep(delay)
+            if i < retries:
+                time.sleep(delay)
 
     msg = (
         "[Redis] Unable to connect after retries.\n"
@@ -37,7 +79,52 @@ def _connect_redis(required: bool = True, retries: int = 5, delay: float = 0.8):
     return None
 
 
-redis = _connect_redis(required=True)
+_redis: Redis | None = None
+_redis_retry_at = 0.0
+_redis_lock = threading.Lock()
+
+
+def get_redis() -> Redis | None:
+    """
+    Connect on first use instead of at import time. While Redis is down the
+    cache runs in a degraded, cache-less mode (every lookup is a miss) and a
+    reconnect is attempted at most once per `redis_retry_sec`.
+    """
+    global _redis, _redis_retry_at
+    if _redis is not None:
+        return _redis
+
+    with _redis_lock:
+        if _redis is None and time.monotonic() >= _redis_retry_at:
+            _redis = _connect_redis(required=False, retries=1)
+            if _redis is None:
+                _redis_retry_at = time.monotonic() + settings.redis_retry_sec
+    return _redis
+
+
+def require_redis() -> Redis:
+    """Blocking connect with retries; exits if Redis stays unreachable."""
+    global _redis
+    with _redis_lock:
+        if _redis is None:
+            _redis = _connect_redis(required=True)
+    return _redis
+
+
+def _drop_redis(e: Exception) -> None:
+    global _redis, _redis_retry_at
+    log.warning("[Redis] Cache unavailable, serving without cache: %s", e)
+    with _redis_lock:
+        _redis = None
+        _redis_retry_at = time.monotonic() + settings.redis_retry_sec
+
+
+def _cache_failed(e: Exception) -> None:
+    # a slow call is a miss for this request only; a dead server is dropped
+    if isinstance(e, exceptions.TimeoutError):
+        log.warning("[Redis] Cache call timed out, treating as a miss: %s", e)
+    else:
+        _drop_redis(e)
 
 
 def _stable_dict(d: dict) -> bytes:
@@ -45,29 +132,214 @@ def _stable_dict(d: dict) -> bytes:
     return orjson.dumps(d, option=orjson.OPT_SORT_KEYS)
 
 
+def provider_name(provider) -> str:
+    """Short provider name for tags, e.g. TravelpayoutsProvider -> travelpayouts."""
+    name = provider.__class__.__name__.lower()
+    for suffix in ("provider", "client"):
+        name = name.removesuffix(suffix)
+    return name
+
+
+def cache_tags(provider, req: FlightRequest) -> list[str]:
+    """Tags a flights entry is indexed under, for targeted purges."""
+    origin, destination = req.origin.upper(), req.destination.upper()
+    tags = [f"provider:{provider_name(provider)}", f"origin:{origin}",
+            f"route:{origin}-{destination}"]
+    try:
+        tags.append(f"month:{coerce_future_iso(req.departureDate).isoformat()[:7]}")
+    except ValueError:
+        pass  # month words etc.: no month tag
+    return tags
+
+
 def make_key(provider, req: FlightRequest) -> str:
     payload = {
         "origin": req.origin.upper(),
         "destination": req.destination.upper(),
         "departureDate": str(req.departureDate),
         "returnDate": str(req.returnDate or ""),
-        "maxPrice": str(req.maxPrice or ""),
+        # entries are in the base currency; only the price limit depends on it
+        "maxPrice": str(to_base(req.maxPrice, req.currency) or ""),
         "nonStop": "1" if bool(req.nonStop) else "0",
-        "currency": (req.currency or "USD").upper(),
-        "max": str(req.max or 10),
+        # no "max": the entry holds the full result set; pages are cut from it
         "provider": provider.__class__.__name__.lower(),
     }
+    h = hashlib.sha256(_stable_dict(payload)).hexdigest()[:32]
+    return flights_key(h)
+
+
+def flights_key(h: str) -> str:
     prefix = "flights"
     # include a version “salt” so you can invalidate format changes by bumping it
     version = "v1"
-    h = hashlib.sha256(_stable_dict(payload)).hexdigest()[:32]
-    return f"{prefix}:{version}:{h}"
+    return f"{prefix}:{version}:{hash_tag(h)}"
+
+
+# --- entry codec ---
+# Stored entries are `MAGIC + codec id + payload`. Entries without the magic
+# prefix are legacy v1 values (plain JSON) and are returned untouched.
+# Every codec decodes back to the JSON bytes it was given, so a hit is still
+# sent as-is after decoding.
+_MAGIC = b"FC\x02"
+CODEC_JSON = 0
+CODEC_ZLIB_DICT = 1
+
+# Shared dictionary for flight results: the repeated keys and the most common
+# values. zlib favours matches near the end, so the hottest strings go last.
+_FLIGHTS_ZDICT = (
+    b'"currency":"EUR""currency":"ILS""deeplink":null,'
+    b'"deeplink":"https://www.aviasales.com/search/'
+    b'TLVPRGBCNFCOLHRJFKCDGFRAMUCVIEATHLCAIST'
+    b'"layovers":[{"at":"","duration_min":}],"return_":null}'
+    b'"flight_number":"","duration_min":,"stops":0}'
+    b'{"origin":"","destination":"","depart_utc":"T00:00:00+00:00",'
+    b'"arrive_utc":"T00:00:00+00:00","carrier":"",'
+    b'"duration_min":,"stops":0,"segments":[{"origin":"","destination":"",'
+    b'"depart_utc":"","arrive_utc":"","carrier":"","flight_number":"",'
+    b'"duration_min":}],"layovers":[]},"return_":{"origin":"",'
+    b'{"options":[{"price":{"amount":,"currency":"USD"},"deeplink":'
+    b'"carriers":[""],"outbound":{"origin":"","destination":"",'
+    b'"depart_utc":"","arrive_utc":"","duration_min":'
+)
+
+CODECS_BY_PREFIX = {
+    "flights": CODEC_ZLIB_DICT,
+    "options": CODEC_ZLIB_DICT,   # same shape as flights entries
+}
+
+
+def _zlib_dict_encode(raw: bytes) -> bytes:
+    c = zlib.compressobj(level=6, wbits=-15, zdict=_FLIGHTS_ZDICT)
+    return c.compress(raw) + c.flush()
+
+
+def _zlib_dict_decode(payload: bytes) -> bytes:
+    d = zlib.decompressobj(wbits=-15, zdict=_FLIGHTS_ZDICT)
+    return d.decompress(payload) + d.flush()
+
+
+_ENCODERS = {
+    CODEC_JSON: lambda raw: raw,
+    CODEC_ZLIB_DICT: _zlib_dict_encode,
+}
+_DECODERS = {
+    CODEC_JSON: lambda payload: payload,
+    CODEC_ZLIB_DICT: _zlib_dict_decode,
+}
+
+
+def codec_for_key(key: str) -> int:
+    return CODECS_BY_PREFIX.get(key.split(":", 1)[0], CODEC_JSON)
+
+
+def encode_entry(raw: bytes, codec: int = CODEC_JSON) -> bytes:
+    return _MAGIC + bytes([codec]) + _ENCODERS[codec](raw)
+
+
+def decode_entry(stored: bytes) -> bytes:
+    if not stored.startswith(_MAGIC):
+        return stored  # legacy v1: plain JSON
+    codec = stored[len(_MAGIC)]
+    return _DECODERS[codec](stored[len(_MAGIC) + 1:])
+
+
+def cache_get_raw(key: str) -> bytes | None:
+    """Return the entry's JSON bytes (ready to send), or None on a miss."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        stored = redis.get(key)
+    except exceptions.RedisError as e:
+        _cache_failed(e)
+        return None
+    return None if stored is None else decode_entry(stored)
+
+
+# --- tag index ---
+# One set of entry keys per tag and write period, so purges never scan the
+# keyspace. A period is as long as the longest entry TTL, so entries written
+# in a period are gone by the end of the next one and its sets expire then:
+# members that outlive their entries are bounded by one period of writes.
+def tag_period_sec() -> int:
+    return max(settings.cache_ttl_max_sec, settings.ttl_sec)
+
+
+def tag_period(at: float | None = None) -> int:
+    return int((time.time() if at is None else at) // tag_period_sec())
+
+
+def live_tag_periods() -> list[int]:
+    """Periods whose tag sets can still name live entries: this one and the last."""
+    current = tag_period()
+    return [current - 1, current]
+
+
+def tag_key(tag: str, period: int) -> str:
+    # all tag sets share a slot so purges can SINTER them on a cluster; that
+    # puts the tag writes of every cached search on one shard (see README)
+    return f"cachetag:v1:{hash_tag('tags')}:{period}:{tag}"
+
+
+def _add_tags(pipe, key: str, tags) -> None:
+    period = tag_period()
+    expire_at = (period + 2) * tag_period_sec()
+    for tag in tags:
+        pipe.sadd(tag_key(tag, period), key)
+        pipe.expireat(tag_key(tag, period), expire_at)
+
+
+def cache_set_raw(key: str, raw: bytes, ttl_sec: int | None = None,
+                  tags: list[str] | None = None) -> None:
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.setex(key, timedelta(seconds=ttl_sec or settings.ttl_sec),
+                   encode_entry(raw, codec_for_key(key)))
+        _add_tags(pipe, key, tags or ())
+        pipe.execute()
+    except exceptions.RedisError as e:
+        _cache_failed(e)
+
+
+def cache_get_many(keys: list[str]) -> list[bytes | None]:
+    """`cache_get_raw` for many keys in one MGET round trip."""
+    redis = get_redis()
+    if redis is None or not keys:
+        return [None] * len(keys)
+    try:
+        # a cluster splits the keys per slot
+        stored = redis.mget_nonatomic(keys) if settings.redis_cluster else redis.mget(keys)
+    except exceptions.RedisError as e:
+        _cache_failed(e)
+        return [None] * len(keys)
+    return [None if s is None else decode_entry(s) for s in stored]
+
+
+def cache_set_many(items: dict[str, bytes], ttls: dict[str, int] | None = None,
+                   tags: dict[str, list[str]] | None = None) -> None:
+    """`cache_set_raw` for many entries in one pipeline."""
+    redis = get_redis()
+    if redis is None or not items:
+        return
+    ttls, tags = ttls or {}, tags or {}
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for key, raw in items.items():
+            pipe.setex(key, timedelta(seconds=ttls.get(key) or settings.ttl_sec),
+                       encode_entry(raw, codec_for_key(key)))
+            _add_tags(pipe, key, tags.get(key, ()))
+        pipe.execute()
+    except exceptions.RedisError as e:
+        _cache_failed(e)
 
 
 def cache_get(key: str):
-    raw = redis.get(key)
+    raw = cache_get_raw(key)
     return None if raw is None else orjson.loads(raw)
 
 
 def cache_set(key: str, value) -> None:
-    redis.setex(key, timedelta(seconds=settings.ttl_sec), orjson.dumps(value))
+    cache_set_raw(key, orjson.dumps(value))
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+from src.infra.cache import get_redis, live_tag_periods, tag_key
+from src.utils.logger import get_logger
+
+log = get_logger()
+
+DELETE_CHUNK = 500
+REPORT_KEYS = 20
+
+
+def purge_tags(tags: List[str], dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Evict the flights entries carrying every tag in `tags` (intersection of
+    the tag sets of each live period, no keyspace scan).
+    """
+    redis = get_redis()
+    if redis is None:
+        raise RuntimeError("Redis is unavailable")
+
+    matched, evicted = [], 0
+    for period in live_tag_periods():
+        sets = [tag_key(t, period) for t in tags]
+        keys = sorted(redis.sinter(sets))
+        matched += keys
+        if dry_run:
+            continue
+        for i in range(0, len(keys), DELETE_CHUNK):
+            chunk = keys[i:i + DELETE_CHUNK]
+            pipe = redis.pipeline(transaction=False)
+            for k in chunk:  # one key per command: entries span cluster slots
+                pipe.unlink(k)
+            for s in sets:
+                pipe.srem(s, *chunk)
+            evicted += sum(pipe.execute()[:len(chunk)])
+
+    # an entry rewritten in the next period is in both periods' sets
+    keys = sorted(set(matched))
+    log.info("[Cache] Purge %s: %d matched, %d evicted", tags, len(keys), evicted)
+    return {
+        "tags": tags,
+        "dryRun": dry_run,
+        "matched": len(keys),
+        "evicted": evicted,  # matched keys that had not expired yet
+        "keys": [k.decode() for k in keys[:REPORT_KEYS]],
+    }
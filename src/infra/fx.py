@@ -0,0 +1,145 @@
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import httpx
+from src.config import get_settings
+from src.core.exceptions import ValidationError
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+STATIC_RATES = Path(__file__).parent / "fx_rates.json"
+
+
+@dataclass(frozen=True)
+class FxTable:
+    """Units of each currency per one unit of `base`."""
+    base: str
+    rates: Dict[str, float]
+    updated_at: float
+    source: str
+
+
+_table: FxTable | None = None
+_lock = threading.Lock()
+
+
+def _rebase(base: str, rates: Dict[str, float], target: str) -> Dict[str, float]:
+    if base == target:
+        return rates
+    pivot = rates[target]
+    return {code: rate / pivot for code, rate in rates.items()}
+
+
+def load_static_table() -> FxTable:
+    data = json.loads(STATIC_RATES.read_text(encoding="utf-8"))
+    rates = {k.upper(): float(v) for k, v in data["rates"].items()}
+    return FxTable(base=settings.base_currency,
+                   rates=_rebase(data["base"].upper(), rates, settings.base_currency),
+                   updated_at=STATIC_RATES.stat().st_mtime,
+                   source="static")
+
+
+def get_fx_table() -> FxTable:
+    """The current table; the bundled static rates until a refresh succeeds."""
+    global _table
+    if _table is None:
+        with _lock:
+            if _table is None:
+                _table = load_static_table()
+    return _table
+
+
+def refresh_rates() -> bool:
+    """Fetch live rates into the local table. Keeps the old table on failure."""
+    global _table
+    url = settings.fx_rates_url.format(base=settings.base_currency)
+    try:
+        with httpx.Client(timeout=10) as client:
+            r = client.get(url)
+            r.raise_for_status()
+            data = r.json()
+        base = (data.get("base_code") or data.get("base") or settings.base_currency).upper()
+        rates = {k.upper(): float(v) for k, v in data["rates"].items()}
+        rates[base] = 1.0
+        table = FxTable(base=settings.base_currency,
+                        rates=_rebase(base, rates, settings.base_currency),
+                        updated_at=time.time(), source=url)
+    except Exception as e:
+        log.warning("[FX] Refresh failed, keeping %s rates: %s", get_fx_table().source, e)
+        return False
+    with _lock:
+        _table = table
+    log.info("[FX] Loaded %d rates (base %s)", len(table.rates), table.base)
+    return True
+
+
+def _rate(currency: str) -> float:
+    try:
+        return get_fx_table().rates[currency.upper()]
+    except KeyError:
+        raise ValidationError(f"unsupported currency: {currency}")
+
+
+def check_currency(currency: str) -> str:
+    """Normalized currency code; ValidationError if the FX table doesn't know it."""
+    _rate(currency)
+    return currency.upper()
+
+
+def convert(amount: int, from_currency: str, to_currency: str) -> int:
+    """Whole-unit amount converted between two currencies, rounded."""
+    if from_currency.upper() == to_currency.upper():
+        return amount
+    return round(amount * _rate(to_currency) / _rate(from_currency))
+
+
+def to_base(amount: Optional[int], currency: Optional[str]) -> Optional[int]:
+    """A limit in `currency` as a base-currency limit (rounded up, so nothing is lost)."""
+    if amount is None:
+        return None
+    currency = (currency or settings.base_currency).upper()
+    if currency == settings.base_currency:
+        return amount
+    return math.ceil(amount * _rate(settings.base_currency) / _rate(currency))
+
+
+def convert_options(options: List[Dict[str, Any]], currency: str,
+                    max_price: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Options repriced in `currency`; `max_price` (same currency) is re-applied after rounding."""
+    currency = check_currency(currency)
+    out = []
+    for o in options:
+        price = o["price"]
+        amount = convert(price["amount"], price["currency"], currency)
+        if max_price is not None and amount > max_price:
+            continue
+        out.append({**o, "price": {**price, "amount": amount, "currency": currency}})
+    return out
+
+
+class FxRefresher:
+    """Refreshes the local FX table in the background every `fx_refresh_sec`."""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        refresh_rates()
+        while not self._stop.wait(settings.fx_refresh_sec):
+            refresh_rates()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="fx-refresher",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,107 @@
+import time
+import orjson
+from datetime import date
+from redis import exceptions
+from src.config import get_settings
+from src.infra.cache import get_redis
+from src.utils.logger import get_logger
+
+settings = get_settings()
+log = get_logger()
+
+# One hash per route and trip type: field = departure day (YYYY-MM-DD),
+# value = cheapest entry seen for that day, with the time it was seen.
+
+
+def calendar_key(origin: str, destination: str, trip_days: int | None) -> str:
+    trip = "ow" if trip_days is None else f"rt{trip_days}"
+    return f"pricecal:v1:{origin.upper()}:{destination.upper()}:{trip}"
+
+
+def _trip_days(option: dict) -> int | None:
+    ret = option.get("return_")
+    if not ret:
+        return None
+    out_day = date.fromisoformat(option["outbound"]["depart_utc"][:10])
+    return (date.fromisoformat(ret["depart_utc"][:10]) - out_day).days
+
+
+def cheapest_per_day(options: list[dict], seen_at: int | None = None) -> dict:
+    """Reduce mapped options to {(calendar_key, day): cheapest entry}."""
+    seen_at = seen_at or int(time.time())
+    cheapest: dict = {}
+    for opt in options:
+        out = opt.get("outbound")
+        if not out:
+            continue
+        key = calendar_key(out["origin"], out["destination"], _trip_days(opt))
+        day = out["depart_utc"][:10]
+        entry = {
+            "amount": opt["price"]["amount"],
+            "currency": opt["price"]["currency"],
+            "deeplink": opt.get("deeplink"),
+            "seen_at": seen_at,
+        }
+        best = cheapest.get((key, day))
+        if best is None or entry["amount"] < best["amount"]:
+            cheapest[(key, day)] = entry
+    return cheapest
+
+
+def _is_fresh(entry: dict, now: float) -> bool:
+    return now - entry["seen_at"] < settings.price_calendar_fresh_sec
+
+
+def record_prices(options: list[dict]) -> None:
+    """Fold one search result into the per-route, per-day cheapest index."""
+    cheapest = cheapest_per_day(options)
+    redis = get_redis()
+    if not cheapest or redis is None:
+        return
+
+    items = list(cheapest.items())
+    now = time.time()
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for (key, day), _ in items:
+            pipe.hget(key, day)
+        current = pipe.execute()
+
+        pipe = redis.pipeline(transaction=False)
+        for ((key, day), entry), raw in zip(items, current):
+            if raw is not None:
+                old = orjson.loads(raw)
+                # a fresh, cheaper (or equal) price wins; stale ones are replaced
+                if (_is_fresh(old, now) and old["currency"] == entry["currency"]
+                        and old["amount"] <= entry["amount"]):
+                    continue
+            pipe.hset(key, day, orjson.dumps(entry))
+            pipe.expire(key, settings.price_calendar_retention_sec)
+        pipe.execute()
+    except exceptions.RedisError as e:
+        log.warning("[PriceCalendar] Index update failed: %s", e)
+
+
+def read_calendar(origin: str, destination: str, days: list[date],
+                  trip_days: int | None = None) -> dict[str, dict]:
+    """Return fresh index entries keyed by ISO day; stale or unknown days are left out."""
+    redis = get_redis()
+    if redis is None or not days:
+        return {}
+
+    fields = [d.isoformat() for d in days]
+    try:
+        raws = redis.hmget(calendar_key(origin, destination, trip_days), fields)
+    except exceptions.RedisError as e:
+        log.warning("[PriceCalendar] Index read failed: %s", e)
+        return {}
+
+    now = time.time()
+    found = {}
+    for day, raw in zip(fields, raws):
+        if raw is None:
+            continue
+        entry = orjson.loads(raw)
+        if _is_fresh(entry, now):
+            found[day] = entry
+    return found
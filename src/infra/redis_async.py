@@ -0,0 +1,68 @@
+import asyncio
+import time
+from redis import exceptions
+from redis.asyncio import Redis, RedisCluster
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from src.config import get_settings
+from src.infra.cache import client_options, decode_entry
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+_client: Redis | RedisCluster | None = None
+_retry_at = 0.0
+
+
+def get_async_redis() -> Redis | RedisCluster | None:
+    """
+    Async client for the event loop, with the same pool, timeout and retry
+    settings as the sync one. Connections are opened on first command.
+    None while a recent connection failure is being waited out.
+    """
+    global _client
+    if time.monotonic() < _retry_at:
+        return None
+    if _client is None:
+        retry = Retry(ExponentialBackoff(cap=settings.redis_retry_backoff_ms / 1000 * 8,
+                                         base=settings.redis_retry_backoff_ms / 1000),
+                      settings.redis_retries)
+        cls = RedisCluster if settings.redis_cluster else Redis
+        _client = cls.from_url(settings.redis_url, retry=retry, **client_options())
+    return _client
+
+
+def _failed(e: BaseException) -> None:
+    global _retry_at
+    if isinstance(e, (asyncio.TimeoutError, exceptions.TimeoutError)):
+        log.warning("[Redis] Async cache call timed out, treating as a miss")
+        return
+    log.warning("[Redis] Async cache unavailable, serving without cache: %s", e)
+    _retry_at = time.monotonic() + settings.redis_retry_sec
+
+
+async def acache_get_raw(key: str) -> bytes | None:
+    """`cache_get_raw` on the event loop; slower than `cache_timeout_ms` is a miss."""
+    redis = get_async_redis()
+    if redis is None:
+        return None
+    try:
+        stored = await asyncio.wait_for(redis.get(key), settings.cache_timeout_ms / 1000)
+    except (asyncio.TimeoutError, exceptions.RedisError, exceptions.RedisClusterException) as e:
+        _failed(e)
+        return None
+    return None if stored is None else decode_entry(stored)
+
+
+async def acache_get_many(keys: list[str]) -> list[bytes | None]:
+    redis = get_async_redis()
+    if redis is None or not keys:
+        return [None] * len(keys)
+    call = redis.mget_nonatomic(keys) if settings.redis_cluster else redis.mget(keys)
+    try:
+        stored = await asyncio.wait_for(call, settings.cache_timeout_ms / 1000)
+    except (asyncio.TimeoutError, exceptions.RedisError, exceptions.RedisClusterException) as e:
+        _failed(e)
+        return [None] * len(keys)
+    return [None if s is None else decode_entry(s) for s in stored]
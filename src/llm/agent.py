@@ -1,16 +1,48 @@
 import json
+import orjson
 from typing import List, Dict, Any, Tuple
 from src.config import Settings
 from langchain.agents import AgentExecutor, create_tool_calling_agent
+from langchain_core.output_parsers import StrOutputParser
+from src.llm.budget import fit_history, format_budgeted_steps
+from src.llm.intent import SEARCH, classify_intent
 from src.llm.tools.flight_tool import search_flights_tool
+from src.llm.tools.multi_city_tool import search_multi_city_tool
+from src.llm.tools.concurrency import run_on_agent_loop
+from src.llm.tools.price_calendar_tool import cheapest_days_tool
+from src.llm.tracing import AgentTrace
 from src.utils.logger import get_logger
-from src.utils.llm import get_chat_prompt_template, get_llm_model
+from src.utils.llm import (
+    get_chat_only_prompt_template, get_chat_prompt_template, get_llm_model,
+    get_small_llm_model,
+)
 from src.utils.date_guard import validate_dates_in_query, PastDateError
 from langchain.memory import ConversationBufferWindowMemory
 
 settings = Settings()
 
 
+def _observation_options(observation) -> List[Dict[str, Any]]:
+    if isinstance(observation, str):
+        try:
+            observation = json.loads(observation)
+        except Exception:
+            return []
+    return observation if isinstance(observation, list) else []
+
+
+def merge_step_options(steps) -> List[Dict[str, Any]]:
+    """Options from every search step (e.g. each compared destination), deduplicated."""
+    seen, merged = set(), []
+    for _, observation in steps:
+        for option in _observation_options(observation):
+            key = orjson.dumps(option, option=orjson.OPT_SORT_KEYS)
+            if key not in seen:
+                seen.add(key)
+                merged.append(option)
+    return merged
+
+
 class LLMAgent:
     def __init__(self):
         self.llm = get_llm_model()
@@ -21,11 +53,14 @@ class LLMAgent:
         if self.executor is not None:
             return self.executor
 
-        tools = [search_flights_tool()]
+        tools = [search_flights_tool(), cheapest_days_tool(),
+                 search_multi_city_tool()]
         prompt = get_chat_prompt_template()
 
+        # the model gets summary rows of tool results, within a token budget
         agent = create_tool_calling_agent(
-            llm=self.llm, tools=tools, prompt=prompt)
+            llm=self.llm, tools=tools, prompt=prompt,
+            message_formatter=format_budgeted_steps)
 
         memory = ConversationBufferWindowMemory(
             memory_key='chat_history', return_messages=True, input_key='input', output_key='output'
@@ -41,36 +76,52 @@ class LLMAgent:
 
         return self.executor
 
+    def answer_directly(self, query: str) -> str:
+        """Small-model reply for non-search messages; shares the agent's chat memory."""
+        executor = self.init_executor()
+        history = executor.memory.load_memory_variables({}).get("chat_history", [])
+        chain = get_chat_only_prompt_template() | get_small_llm_model() | StrOutputParser()
+        trace = AgentTrace("chat")
+        output = chain.invoke({"input": query, "chat_history": fit_history(history)},
+                              config={"callbacks": [trace]})
+        trace.log_summary()
+        executor.memory.save_context({"input": query}, {"output": output})
+        return output
+
     def execute(self, **kwargs) -> Tuple[List[Dict[str, Any]], str]:
         agent_query = kwargs.get("agent")
 
+        intent = classify_intent(agent_query)
+        self.log.info("[Agent] Intent: %s", intent)
+        if intent != SEARCH:
+            try:
+                return [], self.answer_directly(agent_query)
+            except Exception as e:
+                self.log.warning("Direct answer failed, using the agent: %s", e)
+
         try:
             validate_dates_in_query(agent_query)
         except PastDateError as e:
             raise ValueError(f"[ERROR] {e}")
 
         executor = self.init_executor()
+        trace = AgentTrace("agent")
 
         try:
-            result = executor.invoke({"input": agent_query})
+            # async so that the tool calls of one model turn run concurrently
+            result = run_on_agent_loop(executor.ainvoke({"input": agent_query},
+                                                        config={"callbacks": [trace]}))
         except Exception as e:
             self.log.error("Agent failed: %s", e)
             raise Exception("Agent failed: %s", e)
-
-        steps = result.get("intermediate_steps", [])
-        itineraries = []
-        tool_args = {}
-        if steps:
-            action, observation = steps[-1]
-            if isinstance(observation, str):
-                try:
-                    itineraries = json.loads(observation)
-                except Exception:
-                    itineraries = None
-            elif isinstance(observation, list):
-                itineraries = observation
-
-            tool_args = getattr(action, "tool_input", {}) or {}
+        finally:
+            trace.log_summary()
+
+        # only search_flights observations are itineraries
+        steps = [s for s in result.get("intermediate_steps", [])
+                 if getattr(s[0], "tool", None) == "search_flights"]
+        itineraries = merge_step_options(steps)
+        tool_args = (getattr(steps[-1][0], "tool_input", {}) or {}) if steps else {}
 
         if itineraries == [] and tool_args.get("return_date") and tool_args.get("nonstop"):
             relaxed = {**tool_args, "nonstop": False}
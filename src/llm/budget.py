@@ -0,0 +1,117 @@
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from langchain.agents.format_scratchpad.tools import format_to_tool_messages
+from langchain_core.agents import AgentAction
+from langchain_core.messages import BaseMessage
+from src.config import get_settings
+
+settings = get_settings()
+
+# Token budget for what the agent sends back to the model. Tools still
+# return full results (the API response is built from them); the model only
+# sees summary rows of each observation, and older observations shrink to a
+# one-line digest once the scratchpad is over budget.
+
+CHARS_PER_TOKEN = 4  # rough; no tokenizer is shipped for the hosted models
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _leg_row(leg: Optional[Dict[str, Any]]) -> str:
+    if not leg:
+        return "-"
+    return (f'{leg["origin"]}-{leg["destination"]} {leg["depart_utc"][:16]} '
+            f'{leg["duration_min"]}m {leg["stops"]} stops')
+
+
+def _option_row(o: Dict[str, Any]) -> str:
+    row = f'{o["price"]["amount"]} {o["price"]["currency"]} | {",".join(o["carriers"])} | ' \
+          f'out {_leg_row(o.get("outbound"))}'
+    return row + f' | back {_leg_row(o["return_"])}' if o.get("return_") else row
+
+
+def _row(tool: str, item: Dict[str, Any]) -> str:
+    if tool == "cheapest_days":
+        return f'{item["date"]} {item["price"]["amount"]} {item["price"]["currency"]}'
+    if tool == "search_multi_city":
+        legs = " ; ".join(_option_row(o) for o in item["legs"])
+        return f'total {item["total"]["amount"]} {item["total"]["currency"]} || {legs}'
+    return _option_row(item)
+
+
+def _rows(tool: str, observation: Any) -> Optional[List[str]]:
+    if isinstance(observation, str):
+        try:
+            observation = json.loads(observation)
+        except ValueError:
+            return None
+    if not isinstance(observation, list):
+        return None
+    try:
+        return [_row(tool, item) for item in observation]
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _truncate(text: str, tokens: int) -> str:
+    limit = tokens * CHARS_PER_TOKEN
+    return text if len(text) <= limit else text[:limit] + " ...(truncated)"
+
+
+def compact_observation(tool: str, observation: Any,
+                        budget: Optional[int] = None) -> str:
+    """Numbered summary rows of a tool result, as many as fit in `budget` tokens."""
+    budget = budget or settings.agent_observation_tokens
+    rows = _rows(tool, observation)
+    if rows is None:
+        text = observation if isinstance(observation, str) else json.dumps(observation, default=str)
+        return _truncate(text, budget)
+    if not rows:
+        return "No results."
+    out = [f"{len(rows)} results (summary rows; the app shows full details):"]
+    used = estimate_tokens(out[0])
+    for i, row in enumerate(rows, 1):
+        line = f"{i}. {row}"
+        used += estimate_tokens(line)
+        if used > budget:
+            out.append(f"... {len(rows) - i + 1} more")
+            break
+        out.append(line)
+    return "\n".join(out)
+
+
+def _digest(tool: str, observation: Any) -> str:
+    rows = _rows(tool, observation)
+    if rows is None:
+        return _truncate(str(observation), 40)
+    return f"{len(rows)} results (rows omitted to save context)." if rows else "No results."
+
+
+def format_budgeted_steps(intermediate_steps: Sequence[Tuple[AgentAction, Any]]) -> List[BaseMessage]:
+    """
+    `message_formatter` for the tool-calling agent: observations as summary
+    rows, newest first into `agent_scratchpad_tokens`; older ones that no
+    longer fit become a one-line digest.
+    """
+    compacted, used = [], 0
+    for action, observation in reversed(intermediate_steps):
+        text = compact_observation(action.tool, observation)
+        used += estimate_tokens(text)
+        if used > settings.agent_scratchpad_tokens and compacted:
+            text = _digest(action.tool, observation)
+        compacted.append((action, text))
+    return format_to_tool_messages(list(reversed(compacted)))
+
+
+def fit_history(messages: List[BaseMessage], budget: Optional[int] = None) -> List[BaseMessage]:
+    """The newest chat messages that fit in `budget` tokens (oldest dropped first)."""
+    budget = budget or settings.agent_history_tokens
+    kept, used = [], 0
+    for m in reversed(messages):
+        used += estimate_tokens(str(m.content))
+        if used > budget:
+            break
+        kept.append(m)
+    return list(reversed(kept))
@@ -0,0 +1,76 @@
+import re
+from functools import lru_cache
+from src.config import get_settings
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+SEARCH, CHAT = "search", "chat"
+
+_MONTHS = ("jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec|january|february|march|"
+           "april|june|july|august|september|october|november|december")
+_SEARCH_PATTERNS = [
+    re.compile(r"\b(flights?|fly|flying|fares?|tickets?|non-?stop|direct|one[- ]way|"
+               r"round[- ]?trip|return|cheapest|depart\w*|itinerar\w*|multi-?city|"
+               r"open[- ]jaw|layovers?|stopovers?)\b", re.I),
+    re.compile(rf"\b({_MONTHS})\b", re.I),
+    re.compile(r"\b(today|tomorrow|tonight|weekend|next (week|month)|monday|tuesday|"
+               r"wednesday|thursday|friday|saturday|sunday)\b", re.I),
+    re.compile(r"\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}[./]\d{1,2}\b"),
+    re.compile(r"[$€£₪]\s?\d+|\b(under|below|budget|max)\s+\$?\d+", re.I),
+    re.compile(r"\bfrom\s+\w+.{0,40}\bto\s+\w+", re.I),
+]
+_CODE = re.compile(r"\b[A-Z]{3}\b")
+_NOT_IATA = {"USD", "EUR", "GBP", "ILS", "THX", "LOL", "OMG", "BTW", "FAQ", "ASAP"}
+_CHAT_PATTERNS = [
+    re.compile(r"^\s*(hi|hello|hey|hiya|shalom|good (morning|afternoon|evening)|"
+               r"thanks|thank you|thx|bye|goodbye|ok|okay|cool|great)\b", re.I),
+    re.compile(r"\b(who are you|what can you do|help me|how do you work)\b", re.I),
+    re.compile(r"\b(baggage|luggage|carry-?on|suitcase|check-?in|boarding|visa|passport|"
+               r"lounge|security|terminal|seat|pets?|dogs?|cats?|refund|cancel\w*)\b", re.I),
+]
+
+_INTENT_PROMPT = (
+    "Classify the user message for a flight assistant. Reply with exactly one word: "
+    "SEARCH if the user wants to find, compare or price flights, otherwise OTHER.\n\n"
+    "Message: {message}"
+)
+
+
+def classify_by_rules(text: str) -> str | None:
+    """SEARCH / CHAT when the rules are sure, None when the message is ambiguous."""
+    if any(p.search(text) for p in _SEARCH_PATTERNS) \
+            or any(code not in _NOT_IATA for code in _CODE.findall(text)):
+        return SEARCH
+    if any(p.search(text) for p in _CHAT_PATTERNS):
+        return CHAT
+    return None
+
+
+@lru_cache(maxsize=1)
+def _classifier():
+    # imported lazily: only the "ollama" mode needs a model
+    from langchain_ollama import ChatOllama
+    return ChatOllama(model=settings.intent_model_name, temperature=0, num_predict=3)
+
+
+def _classify_by_model(text: str) -> str:
+    reply = _classifier().invoke(_INTENT_PROMPT.format(message=text)).content
+    return CHAT if "OTHER" in reply.upper() else SEARCH
+
+
+def classify_intent(text: str) -> str:
+    """
+    Route a message to the tool-calling agent (SEARCH) or a small direct
+    answer (CHAT). Anything unclear goes to the full agent.
+    """
+    if settings.intent_router == "off":
+        return SEARCH
+    intent = classify_by_rules(text)
+    if intent is None and settings.intent_router == "ollama":
+        try:
+            intent = _classify_by_model(text)
+        except Exception as e:
+            log.warning("[Intent] Classifier failed, using the agent: %s", e)
+    return intent or SEARCH
@@ -0,0 +1,67 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Optional, Tuple
+from src.config import get_settings
+
+settings = get_settings()
+
+# shared by every agent run, so tool calls stay bounded process-wide
+_pool = ThreadPoolExecutor(max_workers=settings.agent_tool_concurrency,
+                           thread_name_prefix="agent-tool")
+
+
+def as_coroutine(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Async twin of a sync tool function, run on the bounded tool pool.
+    The caller's context (e.g. the request deadline) goes with it.
+    """
+    @functools.wraps(func)
+    async def run(*args, **kwargs):
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(_pool, call)
+
+    return run
+
+
+# One event loop per process for agent runs. Clients of the shared LLM bind
+# to the loop they first ran on, so a loop per request (asyncio.run) would
+# leave them on a closed loop.
+_loop: Optional[Tuple[int, asyncio.AbstractEventLoop]] = None
+_loop_lock = threading.Lock()
+
+
+def _agent_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        # a forked child does not inherit the parent's loop thread
+        if _loop is None or _loop[0] != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="agent-loop", daemon=True).start()
+            _loop = (os.getpid(), loop)
+        return _loop[1]
+
+
+def run_on_agent_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Runs `coro` on the process's agent loop and waits for it, in the caller's context."""
+    ctx = contextvars.copy_context()
+    done: Future = Future()
+
+    def finish(task: asyncio.Task) -> None:
+        if task.cancelled():
+            done.cancel()
+        elif task.exception() is not None:
+            done.set_exception(task.exception())
+        else:
+            done.set_result(task.result())
+
+    def start() -> None:
+        loop.create_task(coro, context=ctx).add_done_callback(finish)
+
+    loop = _agent_loop()
+    loop.call_soon_threadsafe(start)
+    return done.result()
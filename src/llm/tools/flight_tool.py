@@ -1,10 +1,16 @@
 from __future__ import annotations
+import orjson
 from typing import Optional, List
 from datetime import date
 from pydantic import BaseModel, Field, field_validator
 from src.app.deps import get_search_service
 
 from src.core.entities import Airport, FlightQuery
+from src.schemas.flight import FlightRequest
+from src.services.nearby import search_nearby
+from src.services.search_cache import search_cached
+from src.utils.deadline import current_deadline
+from src.llm.tools.concurrency import as_coroutine
 from langchain_core.tools import StructuredTool
 
 
@@ -17,6 +23,9 @@ class SearchFlightsInput(BaseModel):
     nonstop: bool = Field(False, description="Require nonstop")
     max_price: Optional[int] = Field(None, description="Max price")
     limit: Optional[int] = Field(5, ge=1, le=20, description="Max results")
+    nearby_radius_km: Optional[int] = Field(
+        None, ge=1, le=300,
+        description="Also search airports within this radius of origin and destination")
 
     @field_validator("origin", "destination")
     @classmethod
@@ -58,7 +67,25 @@ def search_flights_tool() -> StructuredTool:
         nonstop: bool = False,
         max_price: Optional[int] = None,
         limit: Optional[int] = 10,
+        nearby_radius_km: Optional[int] = None,
     ) -> List[dict]:
+        req = FlightRequest(
+            origin=origin,
+            destination=destination,
+            departureDate=date_from.isoformat(),
+            returnDate=return_date.isoformat() if return_date else None,
+            maxPrice=max_price,
+            nonStop=nonstop,
+            max=limit,
+            nearbyRadiusKm=nearby_radius_km,
+        )
+        if nearby_radius_km:
+            return orjson.loads(search_nearby(service, req, current_deadline()))["options"]
+        if date_to is None or date_to == date_from:
+            # single-day searches share the API's cache entries
+            body = search_cached(service, req, deadline=current_deadline())
+            return orjson.loads(body)["options"][: limit or 10]
+
         q = FlightQuery(
             origin=Airport(origin),
             destination=Airport(destination),
@@ -68,11 +95,12 @@ def search_flights_tool() -> StructuredTool:
             nonstop=nonstop,
             max_price=max_price,
         )
-        its = service.execute(q, limit=limit)
+        its = service.execute(q, limit=limit, deadline=current_deadline())
         return its
 
     return StructuredTool.from_function(
         func=run,
+        coroutine=as_coroutine(run),
         name="search_flights",
         description="Search flights and return itineraries.",
         args_schema=SearchFlightsInput,
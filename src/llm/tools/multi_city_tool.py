@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Optional, List
+import datetime as dt
+from pydantic import BaseModel, Field, field_validator
+from src.app.deps import get_multi_city_planner
+from src.schemas.flight import MultiCityLeg, MultiCityRequest
+from src.utils.deadline import current_deadline
+from src.llm.tools.concurrency import as_coroutine
+from langchain_core.tools import StructuredTool
+
+
+class LegInput(BaseModel):
+    origin: str = Field(..., description="Origin IATA, e.g., TLV")
+    destination: str = Field(..., description="Destination IATA, e.g., PRG")
+    date: dt.date = Field(..., description="Departure date (YYYY-MM-DD)")
+
+    @field_validator("origin", "destination")
+    @classmethod
+    def upper_iata(cls, v: str) -> str:
+        return (v or "").upper()
+
+
+class SearchMultiCityInput(BaseModel):
+    legs: List[LegInput] = Field(..., description="Ordered legs of the trip (2-6)")
+    max_price: Optional[int] = Field(None, description="Total budget for all legs")
+    nonstop: bool = Field(False, description="Require nonstop")
+    limit: Optional[int] = Field(3, ge=1, le=10, description="Max combinations")
+
+
+def search_multi_city_tool() -> StructuredTool:
+    """Return a StructuredTool that plans a multi-city / open-jaw trip in one call."""
+    planner = get_multi_city_planner()
+
+    def run(
+        legs: List[dict | LegInput],
+        max_price: Optional[int] = None,
+        nonstop: bool = False,
+        limit: Optional[int] = 3,
+    ) -> List[dict]:
+        legs = [LegInput.model_validate(leg) for leg in legs]
+        req = MultiCityRequest(
+            legs=[MultiCityLeg(origin=leg.origin, destination=leg.destination,
+                               departureDate=leg.date.isoformat()) for leg in legs],
+            maxPrice=max_price,
+            nonStop=nonstop,
+            max=limit or 3,
+        )
+        return planner.plan(req, current_deadline())["combinations"]
+
+    return StructuredTool.from_function(
+        func=run,
+        coroutine=as_coroutine(run),
+        name="search_multi_city",
+        description="Search a multi-city or open-jaw trip (all legs at once) and "
+                    "return the cheapest valid combinations within the total budget.",
+        args_schema=SearchMultiCityInput,
+    )
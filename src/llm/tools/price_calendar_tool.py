@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Optional, List
+from datetime import date
+from pydantic import BaseModel, Field, field_validator
+from src.app.deps import get_price_calendar_service
+from src.services.price_calendar import resolve_range
+from src.utils.deadline import current_deadline
+from src.llm.tools.concurrency import as_coroutine
+from langchain_core.tools import StructuredTool
+
+
+class CheapestDaysInput(BaseModel):
+    origin: str = Field(..., description="Origin IATA, e.g., TLV")
+    destination: str = Field(..., description="Destination IATA, e.g., PRG")
+    month: Optional[str] = Field(
+        None, description="Month to scan (YYYY-MM), e.g., 2025-11")
+    date_from: Optional[date] = Field(
+        None, description="First departure day to scan (YYYY-MM-DD) if no month")
+    date_to: Optional[date] = Field(
+        None, description="Last departure day to scan (YYYY-MM-DD) if no month")
+    trip_days: Optional[int] = Field(
+        None, description="Round trip length in days; omit for one-way")
+    top: Optional[int] = Field(5, ge=1, le=31, description="How many days to return")
+
+    @field_validator("origin", "destination")
+    @classmethod
+    def upper_iata(cls, v: str) -> str:
+        return (v or "").upper()
+
+
+def cheapest_days_tool() -> StructuredTool:
+    """Return a StructuredTool answering 'cheapest day to fly' from the price calendar."""
+    service = get_price_calendar_service()
+
+    def run(
+        origin: str,
+        destination: str,
+        month: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        trip_days: Optional[int] = None,
+        top: Optional[int] = 5,
+    ) -> List[dict]:
+        start, end = resolve_range(month, date_from, date_to)
+        result = service.lookup(origin, destination, start, end, trip_days=trip_days,
+                                deadline=current_deadline())
+        priced = [d for d in result["days"] if d["price"]]
+        priced.sort(key=lambda d: d["price"]["amount"])
+        return priced[: top or 5]
+
+    return StructuredTool.from_function(
+        func=run,
+        coroutine=as_coroutine(run),
+        name="cheapest_days",
+        description="Find the cheapest departure days for a route over a month or date range.",
+        args_schema=CheapestDaysInput,
+    )
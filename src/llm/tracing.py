@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from src.utils.logger import get_logger
+
+log = get_logger()
+
+
+def _usage(response: LLMResult) -> Tuple[Optional[int], Optional[int]]:
+    """(prompt, completion) tokens as reported by the provider, if it reports them."""
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    if usage:
+        return usage.get("prompt_tokens"), usage.get("completion_tokens")
+    for generations in response.generations:
+        for g in generations:
+            meta = getattr(getattr(g, "message", None), "usage_metadata", None)
+            if meta:
+                return meta.get("input_tokens"), meta.get("output_tokens")
+    return None, None
+
+
+class AgentTrace(BaseCallbackHandler):
+    """
+    Timings and token counts of one agent run. Every model call starts a
+    step; tool calls are counted in the step whose model call requested them.
+    """
+    run_inline = True
+
+    def __init__(self, label: str = "agent"):
+        self.label = label
+        self.steps: List[Dict[str, Any]] = []
+        self._step = 0
+        self._started: Dict[UUID, Tuple[float, int, str, str]] = {}
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    def _start(self, run_id: UUID, kind: str, name: str) -> None:
+        with self._lock:
+            if kind == "llm":
+                self._step += 1
+            self._started[run_id] = (time.perf_counter(), self._step, kind, name)
+
+    def _end(self, run_id: UUID, **extra: Any) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            t0, step, kind, name = started
+            self.steps.append({"step": step, "kind": kind, "name": name,
+                               "ms": round((time.perf_counter() - t0) * 1000), **extra})
+
+    def _model_start(self, serialized: Optional[Dict[str, Any]], run_id: UUID, kwargs) -> None:
+        name = (kwargs.get("metadata") or {}).get("ls_model_name") \
+            or (serialized or {}).get("name") or "llm"
+        self._start(run_id, "llm", name)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._model_start(serialized, run_id, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._model_start(serialized, run_id, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs):
+        prompt, completion = _usage(response)
+        self._end(run_id, prompt_tokens=prompt, completion_tokens=completion)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=str(error)[:200])
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        self._start(run_id, "tool", (serialized or {}).get("name") or "tool")
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=str(error)[:200])
+
+    def totals(self) -> Dict[str, Any]:
+        llm = [s for s in self.steps if s["kind"] == "llm"]
+        return {
+            "steps": self._step,
+            "llm_ms": sum(s["ms"] for s in llm),
+            "tool_ms": sum(s["ms"] for s in self.steps if s["kind"] == "tool"),
+            "prompt_tokens": sum(s.get("prompt_tokens") or 0 for s in llm),
+            "completion_tokens": sum(s.get("completion_tokens") or 0 for s in llm),
+            "total_ms": round((time.perf_counter() - self._t0) * 1000),
+        }
+
+    def log_summary(self) -> None:
+        for s in sorted(self.steps, key=lambda s: s["step"]):
+            if s["kind"] == "llm":
+                log.info("[Trace] %s step %d llm %s: %d ms, %s prompt / %s completion tokens%s",
+                         self.label, s["step"], s["name"], s["ms"], s.get("prompt_tokens"),
+                         s.get("completion_tokens"), f' ({s["error"]})' if "error" in s else "")
+            else:
+                log.info("[Trace] %s step %d tool %s: %d ms%s", self.label, s["step"],
+                         s["name"], s["ms"], f' ({s["error"]})' if "error" in s else "")
+        t = self.totals()
+        log.info("[Trace] %s total %d ms over %d steps: llm %d ms, tools %d ms, "
+                 "%d prompt / %d completion tokens", self.label, t["total_ms"], t["steps"],
+                 t["llm_ms"], t["tool_ms"], t["prompt_tokens"], t["completion_tokens"])
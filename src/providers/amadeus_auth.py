@@ -0,0 +1,152 @@
+import hashlib
+import threading
+import time
+import uuid
+import orjson
+from typing import Any, Callable, Dict, Optional
+from redis import exceptions
+from src.config import get_settings
+from src.infra.cache import get_redis
+from src.utils.deadline import Deadline
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+TOKEN_KEY = "amadeus:v1:token:{}"        # {"token", "exp"} shared by all workers
+LOCK_KEY = "amadeus:v1:token-lock:{}"    # held by the one worker refreshing
+EXPIRY_SKEW_SEC = 5
+LOCK_POLL_SEC = 0.05
+
+
+class SharedToken:
+    """
+    OAuth token shared through Redis. One worker refreshes under a lock
+    while the others wait for the result, and a background thread renews
+    the token `amadeus_token_refresh_margin_sec` before it expires, so
+    requests don't hit an expired token. Without Redis the token is only
+    kept in process (refreshes still serialized).
+    """
+
+    def __init__(self, client_id: str, fetch: Callable[[Optional[Deadline]], Dict[str, Any]]):
+        self._fetch = fetch  # -> {"access_token": ..., "expires_in": ...}
+        tag = hashlib.sha256((client_id or "").encode()).hexdigest()[:12]
+        self.token_key, self.lock_key = TOKEN_KEY.format(tag), LOCK_KEY.format(tag)
+        self._token: Optional[str] = None
+        self._exp = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _valid(self, exp: float) -> bool:
+        return time.time() < exp - EXPIRY_SKEW_SEC
+
+    def _read_shared(self) -> Optional[Dict[str, Any]]:
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = redis.get(self.token_key)
+        except exceptions.RedisError as e:
+            log.warning("[Amadeus] Token store unavailable: %s", e)
+            return None
+        return orjson.loads(raw) if raw else None
+
+    def _adopt(self, shared: Optional[Dict[str, Any]], stale: Optional[str]) -> Optional[str]:
+        if shared and shared["token"] != stale and self._valid(shared["exp"]):
+            self._token, self._exp = shared["token"], shared["exp"]
+            return self._token
+        return None
+
+    def get(self, deadline: Optional[Deadline] = None) -> str:
+        self.start()
+        if self._token and self._valid(self._exp):
+            return self._token
+        return self._adopt(self._read_shared(), None) or self.refresh(deadline)
+
+    def refresh(self, deadline: Optional[Deadline] = None, stale: Optional[str] = None) -> str:
+        """
+        A token other than `stale`. Only fetched from the auth URL if no
+        worker has already replaced `stale`.
+        """
+        with self._lock:
+            if self._token and self._token != stale and self._valid(self._exp):
+                return self._token  # another thread refreshed meanwhile
+            token = self._adopt(self._read_shared(), stale)
+            if token:
+                return token
+
+            redis = get_redis()
+            owner = uuid.uuid4().hex.encode()
+            try:
+                locked = redis is not None and redis.set(
+                    self.lock_key, owner, nx=True, ex=settings.amadeus_token_lock_sec)
+            except exceptions.RedisError:
+                redis, locked = None, False
+
+            if redis is not None and not locked:
+                token = self._wait_for_refresh(stale, deadline)
+                if token:
+                    return token
+                log.warning("[Amadeus] Token refresh by another worker timed out")
+
+            try:
+                return self._fetch_and_store(deadline)
+            finally:
+                if locked:
+                    self._release(redis, owner)
+
+    def _wait_for_refresh(self, stale: Optional[str], deadline: Optional[Deadline]) -> Optional[str]:
+        wait = settings.amadeus_token_lock_sec
+        if deadline is not None:
+            wait = min(wait, deadline.remaining())
+        until = time.monotonic() + wait
+        while time.monotonic() < until:
+            time.sleep(LOCK_POLL_SEC)
+            token = self._adopt(self._read_shared(), stale)
+            if token:
+                return token
+        return None
+
+    def _fetch_and_store(self, deadline: Optional[Deadline]) -> str:
+        data = self._fetch(deadline)
+        ttl = int(data.get("expires_in", 0))
+        self._token, self._exp = data["access_token"], time.time() + ttl
+        log.info("[Amadeus] Fetched a new token (expires in %ss)", ttl)
+        redis = get_redis()
+        if redis is not None and ttl > 0:
+            try:
+                redis.set(self.token_key, orjson.dumps({"token": self._token, "exp": self._exp}),
+                          ex=ttl)
+            except exceptions.RedisError as e:
+                log.warning("[Amadeus] Could not share token: %s", e)
+        return self._token
+
+    def _release(self, redis, owner: bytes) -> None:
+        # only delete our own lock; a slow fetch may have outlived it
+        try:
+            if redis.get(self.lock_key) == owner:
+                redis.delete(self.lock_key)
+        except exceptions.RedisError:
+            pass
+
+    # --- proactive refresh ---
+    def _run(self) -> None:
+        while not self._stop.wait(settings.amadeus_token_check_sec):
+            try:
+                current = self._adopt(self._read_shared(), None) or self._token
+                if current and time.time() >= self._exp - settings.amadeus_token_refresh_margin_sec:
+                    self.refresh(stale=current)
+            except Exception as e:
+                log.warning("[Amadeus] Background token refresh failed: %s", e)
+
+    def start(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="amadeus-token",
+                                                    daemon=True)
+                    self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
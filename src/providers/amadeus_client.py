@@ -1,17 +1,22 @@
 from __future__ import annotations
-import time
 import requests
-from typing import List, Dict
+from typing import Any, List, Dict
 from datetime import datetime
 from src.core.entities import FlightQuery, Airport, Segment, Itinerary, Money
 from src.utils.logger import get_logger
 from src.utils.date_guard import normalize_departure, ensure_future
 from src.config import Settings
+from src.providers.amadeus_auth import SharedToken
+from src.utils.deadline import Deadline, call_timeout
 from src.utils.flights import make_roundtrip
+from src.utils.json_stream import iter_json_array
 
 log = get_logger()
 settings = Settings()
 
+MAX_OFFERS = 250  # Flight Offers Search upper bound for `max`
+STREAM_CHUNK_BYTES = 64 * 1024
+
 
 class AmadeusClient:
     """
@@ -25,16 +30,12 @@ class AmadeusClient:
         self.client_id = client_id
         self.client_secret = client_secret
         self.currency = currency
-        self._token: str | None = None
-        self._token_exp: float = 0.0  # epoch seconds
+        # shared with the other workers through Redis, renewed before expiry
+        self.tokens = SharedToken(client_id, self._request_token)
 
     # --- auth ---
-    def _get_token(self) -> str:
-        # reuse if not expired (5s skew)
-        log.info('Getting token.')
-        if self._token and time.time() < self._token_exp - 5:
-            return self._token
-
+    def _request_token(self, deadline: Deadline | None = None) -> Dict[str, Any]:
+        log.info('Requesting token.')
         resp = requests.post(
             settings.amadeus_auth_url,
             data={"grant_type": "client_credentials",
@@ -42,14 +43,13 @@ class AmadeusClient:
                   "client_secret": self.client_secret},
             headers={"Content-Type": "application/x-www-form-urlencoded",
                      "Accept": "application/json"},
-            timeout=30,
+            timeout=call_timeout(deadline, 30),
         )
         resp.raise_for_status()
-        data = resp.json()
-        self._token = data["access_token"]
+        return resp.json()
 
-        self._token_exp = time.time() + int(data.get("expires_in", 0))
-        return self._token
+    def _get_token(self, deadline: Deadline | None = None) -> str:
+        return self.tokens.get(deadline)
 
     def _init_query_params(self, query: FlightQuery, limit: int) -> Dict:
         # --- normalize departure ---
@@ -85,64 +85,84 @@ class AmadeusClient:
 
         return params
 
+    def _offer_to_itinerary(self, offer: Dict) -> Itinerary | None:
+        """Map one flight-offer, reading only price and itinerary segments."""
+        price_total = offer.get("price", {}).get("grandTotal")
+        if not price_total:
+            return None
+
+        itins = offer.get("itineraries", [])
+        if not itins:
+            return None
+
+        # --- outbound (required) ---
+        out_segments, out_min = _segments_and_minutes_from_itin(itins[0])
+        if not out_segments or out_min <= 0:
+            return None
+
+        all_segments = list(out_segments)
+        total_minutes = out_min
+
+        # --- inbound (optional) ---
+        if len(itins) > 1:
+            in_segments, in_min = _segments_and_minutes_from_itin(itins[1])
+            if in_segments and in_min > 0:
+                all_segments.extend(in_segments)
+                total_minutes += in_min
+
+        return Itinerary(
+            segments=all_segments,
+            price=Money(amount=int(float(price_total)),
+                        currency=self.currency),
+            total_duration_min=total_minutes,
+            bags_included=False,
+            deeplink=None,
+        )
+
     # --- search ---
-    def search(self, query: FlightQuery, limit: int = 10) -> List[Itinerary]:
+    def search(self, query: FlightQuery, limit: int = 10,
+               deadline: Deadline | None = None) -> List[Itinerary]:
         log.debug('Invoked request to amadeus api.')
 
-        token = self._get_token()
+        token = self._get_token(deadline)
         params = self._init_query_params(query, limit)
-        # Amadeus doesn't support "price_to" directly in this endpoint; we’ll filter later if needed.
+        if query.max_price is not None:
+            # price_to isn't supported upstream; ask for more offers so the
+            # local filter can still fill `limit`
+            params["max"] = str(min(MAX_OFFERS, limit * 5))
+        resp = self._get_offers(token, params, deadline)
+        if resp.status_code == 401:
+            # token revoked or expired early: one coordinated refresh, one retry
+            resp.close()
+            token = self.tokens.refresh(deadline, stale=token)
+            resp = self._get_offers(token, params, deadline)
+
+        # Map offers as they stream in and stop once `limit` pass the filters,
+        # instead of loading the whole payload (and its dictionaries) first.
+        results: List[Itinerary] = []
+        try:
+            resp.raise_for_status()
+            chunks = resp.iter_content(chunk_size=STREAM_CHUNK_BYTES)
+            for offer in iter_json_array(chunks, "data"):
+                it = self._offer_to_itinerary(offer)
+                if it is None:
+                    continue
+                if query.max_price is not None and it.price.amount > query.max_price:
+                    continue
+                results.append(it)
+                if len(results) >= limit:
+                    break
+        finally:
+            resp.close()
+
+        return make_roundtrip(results)
+
+    def _get_offers(self, token: str, params: Dict, deadline: Deadline | None):
         headers = {"Authorization": f"Bearer {token}",
                    "Accept": "application/json"}
-        resp = requests.get(settings.amadeus_flights_url, headers=headers,
-                            params=params, timeout=30)
-        resp.raise_for_status()
-        payload = resp.json()
-
-        # Map JSON -> domain
-        results: List[Itinerary] = []
-        for offer in payload.get("data", []):
-            price_total = offer.get("price", {}).get("grandTotal")
-            if not price_total:
-                continue
-
-            itins = offer.get("itineraries", [])
-            if not itins:
-                continue
-
-            # --- outbound (required) ---
-            out_segments, out_min = _segments_and_minutes_from_itin(itins[0])
-            if not out_segments or out_min <= 0:
-                continue
-
-            all_segments = list(out_segments)
-            total_minutes = out_min
-
-            # --- inbound (optional) ---
-            if len(itins) > 1:
-                in_segments, in_min = _segments_and_minutes_from_itin(itins[1])
-                if in_segments and in_min > 0:
-                    all_segments.extend(in_segments)
-                    total_minutes += in_min
-
-            results.append(
-                Itinerary(
-                    segments=all_segments,
-                    price=Money(amount=int(float(price_total)),
-                                currency=self.currency),
-                    total_duration_min=total_minutes,
-                    bags_included=False,
-                    deeplink=None,
-                )
-            )
-
-        # simple price filter if query.max_price set
-        if query.max_price is not None:
-            results = [
-                it for it in results if it.price.amount <= query.max_price]
-
-        results = make_roundtrip(results)
-        return results
+        return requests.get(settings.amadeus_flights_url, headers=headers,
+                            params=params, timeout=call_timeout(deadline, 30),
+                            stream=True)
 
 
 def _iso8601_to_minutes(s: str) -> int:
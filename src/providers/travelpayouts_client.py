@@ -4,11 +4,14 @@ import httpx
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from src.core.entities import Airport, Segment, Itinerary, Money, FlightQuery
+from src.utils.deadline import Deadline, call_timeout
 from src.utils.flights import make_roundtrip
 from src.utils.logger import get_logger
 
 log = get_logger()
 
+MAX_LIMIT = 1000  # prices_for_dates upper bound for `limit`
+
 
 def _parse_offset_dt(s: str) -> datetime:
     """
@@ -65,16 +68,17 @@ class TravelpayoutsClient:
             "currency": self.currency,
             "token": self.token,
             "direct": "false",
-            "limit": limit
+            "limit": max(1, min(MAX_LIMIT, limit)),
         }
 
         return params
 
-    def search(self, query: FlightQuery, limit: int = 10) -> List[Itinerary]:
+    def search(self, query: FlightQuery, limit: int = 10,
+               deadline: Deadline | None = None) -> List[Itinerary]:
         params = self._init_params(query, limit)
         log.info("Calling Aviasales prices_for_dates params=%s", params)
 
-        with httpx.Client(timeout=20) as client:
+        with httpx.Client(timeout=call_timeout(deadline, 20)) as client:
             r = client.get(self.base_url, params=params)
             r.raise_for_status()
             payload: Dict[str, Any] = r.json()
@@ -151,7 +155,7 @@ class TravelpayoutsClient:
             results = [
                 it for it in results if it.price.amount <= query.max_price]
 
-        # slice to limit because endpoint doesn’t support it
-        results = results[: max(1, min(10, limit))]
+        # rows skipped above or by max_price can leave fewer than `limit`
+        results = results[: max(1, min(MAX_LIMIT, limit))]
 
         return make_roundtrip(results)
@@ -1,6 +1,7 @@
 from typing import List
 from src.core.entities import FlightQuery, Itinerary
 from src.core.services import FlightProvider
+from src.utils.deadline import Deadline
 from .travelpayouts_client import TravelpayoutsClient
 
 
@@ -8,5 +9,6 @@ class TravelpayoutsProvider(FlightProvider):
     def __init__(self, client: TravelpayoutsClient):
         self.client = client
 
-    def search(self, query: FlightQuery, limit: int) -> List[Itinerary]:
-        return self.client.search(query, limit=limit)
+    def search(self, query: FlightQuery, limit: int,
+               deadline: Deadline | None = None) -> List[Itinerary]:
+        return self.client.search(query, limit=limit, deadline=deadline)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 
 class FlightRequest(BaseModel):
@@ -15,6 +15,38 @@ class FlightRequest(BaseModel):
     nonStop: Optional[bool] = False
     currency: Optional[str] = "USD"
     max: Optional[int] = 10
+    nearbyRadiusKm: Optional[int] = Field(
+        None, ge=1, le=300, description="Also search airports within this radius")
+    nearby: Literal["origin", "destination", "both"] = "both"
+    sort: Literal["default", "price", "duration", "departure", "pareto"] = "default"
+    cursor: Optional[str] = Field(
+        None, description="nextCursor from the previous page")
+
+
+class CachePurgeRequest(BaseModel):
+    provider: Optional[str] = Field(None, description="e.g. amadeus, travelpayouts")
+    origin: Optional[str] = Field(None, description="IATA code")
+    destination: Optional[str] = Field(
+        None, description="IATA code; needs origin (purges the route)")
+    month: Optional[str] = Field(None, pattern=r"^\d{4}-\d{2}$",
+                                 description="Departure month, YYYY-MM")
+    dryRun: bool = False
+
+
+class MultiCityLeg(BaseModel):
+    origin: str = Field(..., description="IATA code, e.g. TLV")
+    destination: str = Field(..., description="IATA code, e.g. PRG")
+    departureDate: str = Field(..., description="YYYY-MM-DD")
+
+
+class MultiCityRequest(BaseModel):
+    legs: List[MultiCityLeg] = Field(..., min_length=2, max_length=6)
+    maxPrice: Optional[int] = Field(
+        None, ge=1, description="Total budget across all legs")
+    nonStop: Optional[bool] = False
+    currency: Optional[str] = "USD"
+    perLeg: Optional[int] = Field(10, ge=1, le=20)
+    max: Optional[int] = Field(5, ge=1, le=20)
 
 
 class AgentRequest(BaseModel):
@@ -65,8 +97,82 @@ class FlightOption(BaseModel):
 
 class FlightResponse(BaseModel):
     options: List[FlightOption]
+    nextCursor: Optional[str] = None
+
+
+class FlightBatchRequest(BaseModel):
+    requests: List[FlightRequest] = Field(..., min_length=1)
+
+
+class BatchError(BaseModel):
+    status: int
+    detail: str
+
+
+class BatchItem(BaseModel):
+    options: List[FlightOption] = []
+    nextCursor: Optional[str] = None
+    error: Optional[BatchError] = None
+
+
+class FlightBatchResponse(BaseModel):
+    results: List[BatchItem]
 
 
 class AgentResponse(BaseModel):
     options: List[FlightOption]
     output: Optional[str]
+
+
+class TripCombination(BaseModel):
+    total: Price
+    legs: List[FlightOption]  # in leg order
+
+
+class MultiCityResponse(BaseModel):
+    combinations: List[TripCombination]
+    options_per_leg: List[int]
+
+
+class CalendarDay(BaseModel):
+    date: str              # YYYY-MM-DD departure day
+    price: Optional[Price] = None
+    deeplink: Optional[str] = None
+    seen_at: Optional[int] = None  # epoch seconds the price was observed
+
+
+class PriceCalendarResponse(BaseModel):
+    origin: str
+    destination: str
+    trip_days: Optional[int] = None
+    days: List[CalendarDay]
+    cheapest: Optional[CalendarDay] = None
+    upstream_calls: int
+
+
+class WatchCreate(BaseModel):
+    origin: str = Field(..., description="IATA code, e.g. TLV")
+    destination: str = Field(..., description="IATA code, e.g. PRG")
+    departureDate: str = Field(..., description="YYYY-MM-DD")
+    returnDate: Optional[str] = None
+    nonStop: Optional[bool] = False
+    currency: Optional[str] = "USD"
+    maxPrice: Optional[int] = Field(
+        None, ge=1, description="Alert threshold for this watch")
+
+
+class PriceDrop(BaseModel):
+    old_min_price: Optional[int] = None
+    new_min_price: Optional[int] = None
+    currency: Optional[str] = None
+    dropped_options: int
+    at: float
+
+
+class Watch(WatchCreate):
+    id: str
+    created_at: float
+    min_price: Optional[int] = None      # from the last shared poll
+    polled_at: Optional[float] = None
+    below_max_price: Optional[bool] = None
+    drops: List[PriceDrop] = []
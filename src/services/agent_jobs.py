@@ -0,0 +1,242 @@
+import threading
+import time
+import uuid
+import orjson
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+from src.config import get_settings
+from redis import exceptions
+from src.infra.cache import get_redis, hash_tag, new_redis_client
+from src.utils.logger import get_logger
+
+settings = get_settings()
+log = get_logger()
+
+# one slot on a cluster: submit's MULTI and BLMOVE span several of these keys
+_PREFIX = f"agentjob:v1:{hash_tag('jobs')}"
+QUEUE_KEY = f"{_PREFIX}:queue"
+PROCESSING_KEY = f"{_PREFIX}:processing"  # claimed by a worker, not finished yet
+LEASES_KEY = f"{_PREFIX}:leases"          # job id -> lease deadline (epoch seconds)
+REAPER_KEY = f"{_PREFIX}:reaper"          # one worker reaps per lease period
+TERMINAL = ("done", "failed")
+
+
+def job_key(job_id: str) -> str:
+    return f"{_PREFIX}:{job_id}"
+
+
+def run_agent_job(query: str) -> Dict[str, Any]:
+    """Worker-side entry point: run the LLM agent loop for one query."""
+    # imported here so only worker processes pay for LangChain
+    from src.app.deps import get_llm_agent
+    options, output = get_llm_agent().execute(agent=query)
+    return {"options": options or [], "output": output}
+
+
+def _new_job(query: str) -> Dict[str, Any]:
+    now = time.time()
+    return {"id": uuid.uuid4().hex, "status": "queued", "query": query,
+            "options": [], "output": None, "error": None, "attempts": 0,
+            "created_at": now, "updated_at": now}
+
+
+def _finish(job: Dict[str, Any], result: Optional[Dict[str, Any]] = None,
+            error: Optional[BaseException] = None) -> Dict[str, Any]:
+    if error is not None:
+        log.error("Agent job %s failed: %s", job["id"], error)
+        detail = str(error) if isinstance(error, ValueError) else "Agent failed"
+        job.update(status="failed", error=detail)
+    else:
+        job.update(status="done", **(result or {}))
+    job["updated_at"] = time.time()
+    return job
+
+
+class LocalAgentJobs:
+    """
+    Jobs run in a process pool owned by this API process; job state lives
+    in memory. Good for a single API instance. Finished jobs are dropped
+    `agent_job_ttl_sec` after their last update, as the Redis keys expire.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def _expire(self) -> None:
+        cutoff = time.time() - settings.agent_job_ttl_sec
+        with self._lock:
+            stale = [job_id for job_id, job in self._jobs.items()
+                     if job["status"] in TERMINAL and job["updated_at"] < cutoff]
+            for job_id in stale:
+                del self._jobs[job_id]
+
+    def submit(self, query: str) -> Dict[str, Any]:
+        self._expire()
+        job = _new_job(query)
+        with self._lock:
+            self._jobs[job["id"]] = job
+        fut = self._get_pool().submit(run_agent_job, query)
+        self._futures[job["id"]] = fut
+        fut.add_done_callback(lambda f, job_id=job["id"]: self._on_done(job_id, f))
+        return dict(job)
+
+    def _on_done(self, job_id: str, fut: Future) -> None:
+        self._futures.pop(job_id, None)
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        err = fut.exception()
+        _finish(job, None if err else fut.result(), err)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self._expire()
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        fut = self._futures.get(job_id)
+        if job["status"] == "queued" and fut is not None and fut.running():
+            job["status"] = "running"
+        return dict(job)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class RedisAgentJobs:
+    """
+    Jobs are pushed to a Redis list and executed by separate worker
+    processes (`python -m src.workers.agent_worker`), so API and LLM
+    capacity scale independently. Job state is stored in Redis.
+    """
+
+    def __init__(self):
+        self._queue = None  # own client: BRPOP outlives the cache socket timeout
+
+    def _redis(self):
+        redis = get_redis()
+        if redis is None:
+            raise RuntimeError("Redis is unavailable")
+        return redis
+
+    def _save(self, redis, job: Dict[str, Any]) -> None:
+        redis.setex(job_key(job["id"]), settings.agent_job_ttl_sec, orjson.dumps(job))
+
+    def submit(self, query: str) -> Dict[str, Any]:
+        redis = self._redis()
+        job = _new_job(query)
+        pipe = redis.pipeline()
+        self._save(pipe, job)
+        pipe.lpush(QUEUE_KEY, job["id"])
+        pipe.execute()
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._redis().get(job_key(job_id))
+        return None if raw is None else orjson.loads(raw)
+
+    def work_one(self, timeout: int = 5) -> bool:
+        """
+        Claim and run one job; returns False if the queue stayed empty.
+        The job sits in the processing list under a lease that a heartbeat
+        renews while it runs, so a crashed worker's job is reaped.
+        """
+        redis = self._redis()
+        self.reap(redis)
+        if self._queue is None:
+            self._queue = new_redis_client(blocking=True)
+        job_id = self._queue.blmove(QUEUE_KEY, PROCESSING_KEY, timeout, "RIGHT", "LEFT")
+        if job_id is None:
+            return False
+        job_id = job_id.decode()
+        self._renew(redis, job_id)
+        job = self.get(job_id)
+        if job is None:
+            self._release(redis, job_id)
+            return True  # expired before a worker picked it up
+
+        job.update(status="running", updated_at=time.time(),
+                   attempts=job.get("attempts", 0) + 1)
+        self._save(redis, job)
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job_id, stop),
+                                     name="agent-job-heartbeat", daemon=True)
+        heartbeat.start()
+        try:
+            _finish(job, run_agent_job(job["query"]))
+        except Exception as e:
+            _finish(job, error=e)
+        finally:
+            stop.set()
+        self._save(redis, job)
+        self._release(redis, job_id)
+        return True
+
+    def _renew(self, redis, job_id: str) -> None:
+        redis.zadd(LEASES_KEY, {job_id: time.time() + settings.agent_job_lease_sec})
+
+    def _heartbeat(self, job_id: str, stop: threading.Event) -> None:
+        while not stop.wait(settings.agent_job_lease_sec / 3):
+            try:
+                self._renew(self._redis(), job_id)
+            except (RuntimeError, exceptions.RedisError) as e:
+                log.warning("Agent job %s heartbeat failed: %s", job_id, e)
+
+    def _release(self, redis, job_id: str) -> None:
+        pipe = redis.pipeline(transaction=False)
+        pipe.lrem(PROCESSING_KEY, 1, job_id)
+        pipe.zrem(LEASES_KEY, job_id)
+        pipe.execute()
+
+    def reap(self, redis=None) -> int:
+        """
+        Re-queue (or, after `agent_job_max_attempts`, fail) claimed jobs
+        whose lease ran out. A job without a lease gets one lease period
+        first: its worker may be between the claim and the first renewal.
+        """
+        redis = redis or self._redis()
+        if not redis.set(REAPER_KEY, b"1", nx=True, ex=settings.agent_job_lease_sec):
+            return 0  # another worker reaped recently
+        now, reaped = time.time(), 0
+        for raw_id in redis.lrange(PROCESSING_KEY, 0, -1):
+            job_id = raw_id.decode()
+            lease = redis.zscore(LEASES_KEY, job_id)
+            if lease is None:
+                redis.zadd(LEASES_KEY, {job_id: now + settings.agent_job_lease_sec}, nx=True)
+                continue
+            # LREM decides which reaper owns the stale job
+            if lease > now or not redis.lrem(PROCESSING_KEY, 1, job_id):
+                continue
+            redis.zrem(LEASES_KEY, job_id)
+            reaped += 1
+            job = self.get(job_id)
+            if job is None or job["status"] in TERMINAL:
+                continue
+            if job.get("attempts", 0) < settings.agent_job_max_attempts:
+                log.warning("Agent job %s lost its worker, re-queueing", job_id)
+                job.update(status="queued", updated_at=now)
+                self._save(redis, job)
+                redis.rpush(QUEUE_KEY, job_id)  # next to be claimed
+            else:
+                _finish(job, error=RuntimeError("agent worker stopped"))
+                self._save(redis, job)
+        return reaped
+
+    def shutdown(self) -> None:
+        pass
+
+
+def make_agent_jobs():
+    if settings.agent_jobs_mode == "redis":
+        return RedisAgentJobs()
+    return LocalAgentJobs(workers=settings.agent_workers)
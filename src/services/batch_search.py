@@ -0,0 +1,113 @@
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from fastapi import HTTPException
+from src.config import get_settings
+from src.core.exceptions import DomainError
+from src.core.services import SearchFlightsService
+from src.infra.adaptive_ttl import entry_ttls
+from src.infra.cache import cache_get_many, cache_set_many, cache_tags, make_key
+from src.infra.redis_async import acache_get_many
+from src.schemas.flight import FlightRequest
+from src.services.result_views import page_position, page_view
+from src.services.search_cache import departure_of, fetch_result_set, in_request_currency
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.logger import get_logger
+
+log = get_logger()
+settings = get_settings()
+
+
+def _item_error(e: Exception, deadline: Deadline | None) -> Dict[str, Any]:
+    if isinstance(e, HTTPException):
+        return {"status": e.status_code, "detail": e.detail}
+    if isinstance(e, (DomainError, ValueError)):
+        return {"status": 422, "detail": str(e)}
+    if isinstance(e, DeadlineExceeded) or (deadline is not None and deadline.expired()):
+        return {"status": 504, "detail": "Search deadline exceeded"}
+    log.error("Provider error in batch: %s", e)
+    return {"status": 502, "detail": "Upstream search failed"}
+
+
+def search_batch(service: SearchFlightsService, reqs: List[FlightRequest],
+                 deadline: Deadline | None = None) -> bytes:
+    """
+    Many searches in one call: one MGET for every key, identical misses
+    searched once (keys ignore currency and page size), at most
+    `batch_concurrency` upstream calls at a time, and one pipelined
+    write-back. Each item gets either a page or its own error.
+    """
+    results, keys = _batch_keys(service, reqs, deadline)
+    unique = list(dict.fromkeys(keys.values()))
+    bodies = dict(zip(unique, cache_get_many(unique)))
+    return _complete_batch(service, reqs, deadline, results, keys, bodies)
+
+
+async def search_batch_async(service: SearchFlightsService, reqs: List[FlightRequest],
+                             deadline: Deadline | None = None) -> bytes:
+    """`search_batch` with the MGET on the event loop; only misses go to a thread."""
+    results, keys = _batch_keys(service, reqs, deadline)
+    unique = list(dict.fromkeys(keys.values()))
+    bodies = dict(zip(unique, await acache_get_many(unique)))
+    if any(b is None for b in bodies.values()):
+        return await asyncio.to_thread(
+            _complete_batch, service, reqs, deadline, results, keys, bodies)
+    return _complete_batch(service, reqs, deadline, results, keys, bodies)
+
+
+def _batch_keys(service: SearchFlightsService, reqs: List[FlightRequest],
+                deadline: Deadline | None):
+    results: List[Dict[str, Any] | None] = [None] * len(reqs)
+    keys: Dict[int, str] = {}
+    for i, req in enumerate(reqs):
+        try:
+            if req.nearbyRadiusKm:
+                raise ValueError("nearby search is not supported in a batch")
+            key = make_key(service.provider, req)
+            page_position(req, key)  # bad cursors fail before any search
+            keys[i] = key
+        except Exception as e:
+            results[i] = {"error": _item_error(e, deadline)}
+    return results, keys
+
+
+def _complete_batch(service: SearchFlightsService, reqs: List[FlightRequest],
+                    deadline: Deadline | None, results: List[Dict[str, Any] | None],
+                    keys: Dict[int, str], bodies: Dict[str, bytes | None]) -> bytes:
+    unique = list(bodies)
+    # one representative request per missing key
+    misses = {keys[i]: reqs[i] for i in keys if bodies[keys[i]] is None}
+    log.info("Batch of %d: %d keys, %d cache hits, %d upstream searches",
+             len(reqs), len(unique), len(unique) - len(misses), len(misses))
+
+    errors: Dict[str, Exception] = {}
+    if misses:
+        def fetch(item):
+            key, req = item
+            try:
+                return key, fetch_result_set(service, req, deadline)
+            except Exception as e:
+                errors[key] = e
+                return key, None
+
+        workers = min(len(misses), settings.batch_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = {k: b for k, b in pool.map(fetch, misses.items()) if b is not None}
+        ttls = entry_ttls([(k, departure_of(misses[k]), b) for k, b in fetched.items()])
+        cache_set_many(fetched, ttls=dict(zip(fetched, ttls)),
+                       tags={k: cache_tags(service.provider, misses[k]) for k in fetched})
+        bodies.update(fetched)
+
+    for i, key in keys.items():
+        if key in errors:
+            results[i] = {"error": _item_error(errors[key], deadline)}
+            continue
+        try:
+            body = in_request_currency(bodies[key], reqs[i])
+            results[i] = {**page_view(body, reqs[i], key), "error": None}
+        except Exception as e:
+            results[i] = {"error": _item_error(e, deadline)}
+
+    # options were validated when cached, so they are dumped as-is
+    return orjson.dumps({"results": results})
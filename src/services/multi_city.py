@@ -0,0 +1,119 @@
+import heapq
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from src.config import get_settings
+from src.core.services import SearchFlightsService
+from src.schemas.flight import FlightRequest, MultiCityRequest
+from src.services.result_views import sort_options
+from src.services.search_cache import search_cached
+from src.utils.date_guard import coerce_future_iso
+from src.utils.deadline import Deadline
+
+settings = get_settings()
+
+
+def _leg_times(option: Dict[str, Any]) -> Tuple[datetime, datetime]:
+    out = option["outbound"]
+    return (datetime.fromisoformat(out["depart_utc"]),
+            datetime.fromisoformat(out["arrive_utc"]))
+
+
+def best_combinations(leg_options: List[List[Dict[str, Any]]],
+                      budget: Optional[int] = None, k: int = 5,
+                      max_expansions: int = 5000) -> List[List[Dict[str, Any]]]:
+    """
+    Cheapest `k` combinations (one option per leg) whose legs don't overlap
+    in time and whose total fits `budget`.
+
+    Best-first over index tuples into the price-sorted option lists: a
+    combination is only expanded after every cheaper one, so the search
+    stops at the first total over budget instead of walking the full
+    cartesian product.
+    """
+    if not leg_options or any(not opts for opts in leg_options):
+        return []
+
+    legs = [sorted(opts, key=lambda o: o["price"]["amount"]) for opts in leg_options]
+    times = [[_leg_times(o) for o in opts] for opts in legs]
+
+    def total(idx: Tuple[int, ...]) -> int:
+        return sum(legs[i][j]["price"]["amount"] for i, j in enumerate(idx))
+
+    def feasible(idx: Tuple[int, ...]) -> bool:
+        return all(times[i][idx[i]][1] < times[i + 1][idx[i + 1]][0]
+                   for i in range(len(idx) - 1))
+
+    start = (0,) * len(legs)
+    heap = [(total(start), start)]
+    seen = {start}
+    found: List[List[Dict[str, Any]]] = []
+    expansions = 0
+
+    while heap and len(found) < k and expansions < max_expansions:
+        cost, idx = heapq.heappop(heap)
+        if budget is not None and cost > budget:
+            break  # everything left on the heap costs at least this much
+        expansions += 1
+        if feasible(idx):
+            found.append([legs[i][j] for i, j in enumerate(idx)])
+
+        for i in range(len(idx)):
+            if idx[i] + 1 < len(legs[i]):
+                nxt = idx[:i] + (idx[i] + 1,) + idx[i + 1:]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    heapq.heappush(heap, (total(nxt), nxt))
+
+    return found
+
+
+@dataclass
+class MultiCityPlanner:
+    """Multi-city / open-jaw trips: all legs searched at once, then combined."""
+    search: SearchFlightsService
+
+    def _leg_requests(self, req: MultiCityRequest) -> List[FlightRequest]:
+        dates = [coerce_future_iso(leg.departureDate) for leg in req.legs]
+        if any(b < a for a, b in zip(dates, dates[1:])):
+            raise ValueError("legs must be in chronological order")
+        return [
+            FlightRequest(
+                origin=leg.origin,
+                destination=leg.destination,
+                departureDate=d.isoformat(),
+                nonStop=req.nonStop,
+                currency=req.currency,
+                max=req.perLeg,
+            )
+            for leg, d in zip(req.legs, dates)
+        ]
+
+    def plan(self, req: MultiCityRequest, deadline: Deadline | None = None) -> Dict[str, Any]:
+        leg_reqs = self._leg_requests(req)
+        with ThreadPoolExecutor(max_workers=min(len(leg_reqs), settings.multi_city_concurrency)) as pool:
+            bodies = list(pool.map(
+                lambda r: search_cached(self.search, r, deadline=deadline), leg_reqs))
+
+        leg_options = [
+            sort_options([o for o in orjson.loads(body)["options"] if o.get("outbound")],
+                         "price")[:req.perLeg]
+            for body in bodies
+        ]
+        combos = best_combinations(leg_options, budget=req.maxPrice, k=req.max or 5)
+
+        return {
+            "combinations": [
+                {
+                    "total": {
+                        "amount": sum(o["price"]["amount"] for o in legs),
+                        "currency": legs[0]["price"]["currency"],
+                    },
+                    "legs": legs,
+                }
+                for legs in combos
+            ],
+            "options_per_leg": [len(opts) for opts in leg_options],
+        }
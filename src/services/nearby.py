@@ -0,0 +1,66 @@
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from src.config import get_settings
+from src.core.services import SearchFlightsService
+from src.infra.airports.airports_loader import nearby_airports
+from src.schemas.flight import FlightRequest
+from src.services.option_views import OptionFormat, stored_ids
+from src.services.result_views import sort_options
+from src.services.search_cache import search_cached
+from src.utils.deadline import Deadline
+from src.utils.logger import get_logger
+
+settings = get_settings()
+log = get_logger()
+
+
+def expand_request(req: FlightRequest) -> List[FlightRequest]:
+    """One plain request per (origin, destination) pair within the radius."""
+    radius = req.nearbyRadiusKm
+    limit = settings.nearby_max_airports
+    origins = nearby_airports(req.origin, radius, limit) \
+        if req.nearby in ("origin", "both") else [req.origin.upper()]
+    destinations = nearby_airports(req.destination, radius, limit) \
+        if req.nearby in ("destination", "both") else [req.destination.upper()]
+
+    return [
+        req.model_copy(update={"origin": o, "destination": d,
+                               "nearbyRadiusKm": None, "cursor": None})
+        for o in origins for d in destinations if o != d
+    ]
+
+
+def search_nearby(service: SearchFlightsService, req: FlightRequest,
+                  deadline: Deadline | None = None,
+                  fmt: OptionFormat | None = None) -> bytes:
+    """
+    Search every nearby airport pair concurrently (each pair goes through
+    the cache on its own) and return the best `req.max` options overall.
+    """
+    pair_reqs = expand_request(req)
+    errors: List[Exception] = []
+
+    def fetch(r: FlightRequest) -> List[Dict[str, Any]]:
+        try:
+            return orjson.loads(search_cached(service, r, deadline=deadline))["options"]
+        except Exception as e:
+            log.warning("Nearby search %s-%s failed: %s", r.origin, r.destination, e)
+            errors.append(e)
+            return []
+
+    workers = max(1, min(len(pair_reqs), settings.nearby_concurrency))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fetch, pair_reqs))
+
+    if pair_reqs and len(errors) == len(pair_reqs):
+        raise errors[0]
+
+    merged = [o for opts in results for o in opts]
+    ordered = sort_options(merged, "price" if req.sort == "default" else req.sort)
+    page = {"options": ordered[: req.max or 10]}
+    if fmt is not None and not fmt.is_default:
+        # merged from several entries, so the list is stored for detail lookups
+        return fmt.render(page, stored_ids(page["options"]))
+    # options were validated when cached, so they are dumped as-is
+    return orjson.dumps(page)
@@ -0,0 +1,176 @@
+import hashlib
+import orjson
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from src.config import get_settings
+from src.core.exceptions import ValidationError
+from src.infra.cache import cache_get_raw, cache_set_raw, flights_key, hash_tag
+from src.infra.fx import convert_options
+
+try:  # optional: only offered when installed
+    import msgpack
+except ImportError:
+    msgpack = None
+
+settings = get_settings()
+
+# Projected / compact views of flight options for list screens. Each option
+# gets an ID from which its full details are fetched later:
+#   f.<entry>.<digest>  option of the cached flights entry <entry>
+#   r.<entry>.<digest>  option of a stored result list (nearby, agent)
+# The digest leaves out the price, so it is the same in every currency.
+
+JSON = "application/json"
+COLUMNAR = "application/vnd.flightcopilot.columnar+json"
+MSGPACK = "application/msgpack"
+_MEDIA_TYPES = {JSON: JSON, COLUMNAR: COLUMNAR,
+                MSGPACK: MSGPACK, "application/x-msgpack": MSGPACK}
+
+OPTIONS_KEY = "options:v1:{}"     # result list served with IDs (not a flights entry)
+
+TOP_FIELDS = ("id", "price", "deeplink", "carriers", "outbound", "return_")
+SUB_FIELDS = {
+    "price": ("amount", "currency"),
+    "outbound": ("origin", "destination", "depart_utc", "arrive_utc",
+                 "duration_min", "stops", "segments", "layovers"),
+}
+SUB_FIELDS["return_"] = SUB_FIELDS["outbound"]
+_LEG_SUMMARY = ("origin", "destination", "depart_utc", "arrive_utc", "duration_min", "stops")
+# what the results list shows
+SUMMARY = ("id", "price", "carriers") + tuple(
+    f"{leg}.{f}" for leg in ("outbound", "return_") for f in _LEG_SUMMARY)
+
+
+def parse_fields(spec: Optional[str]) -> Tuple[str, ...]:
+    """
+    `fields=` as a tuple of paths: top-level names, `leg.field` /
+    `price.field` sub-paths and `summary`. The ID always comes first.
+    """
+    if not spec:
+        return ()
+    paths: List[str] = []
+    for name in (p.strip() for p in spec.split(",")):
+        for path in (SUMMARY if name == "summary" else (name,)):
+            head, _, sub = path.partition(".")
+            if head not in TOP_FIELDS or (sub and sub not in SUB_FIELDS.get(head, ())):
+                raise ValidationError(f"unknown field: {name}")
+            if path not in paths:
+                paths.append(path)
+    # a whole object covers its sub-paths
+    paths = [p for p in paths if "." not in p or p.partition(".")[0] not in paths]
+    return ("id",) + tuple(p for p in paths if p != "id")
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """Best media type the client accepts, JSON by default; None if none can be served."""
+    if not accept:
+        return JSON
+    ranked = []
+    for i, part in enumerate(accept.split(",")):
+        media, *params = (s.strip() for s in part.split(";"))
+        q = 1.0
+        for p in params:
+            if p.startswith("q="):
+                try:
+                    q = float(p[2:])
+                except ValueError:
+                    q = 0.0
+        ranked.append((-q, i, media.lower()))
+    for q, _, media in sorted(ranked):
+        if q == 0:
+            break
+        if media in ("*/*", "application/*"):
+            return JSON
+        served = _MEDIA_TYPES.get(media)
+        if served == MSGPACK and msgpack is None:
+            continue
+        if served:
+            return served
+    return None
+
+
+def _value(option: Dict[str, Any], option_id: str, path: str) -> Any:
+    if path == "id":
+        return option_id
+    head, _, sub = path.partition(".")
+    value = option.get(head)
+    return value.get(sub) if sub and value is not None else value
+
+
+def project(option: Dict[str, Any], option_id: str, paths: Tuple[str, ...]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for path in paths:
+        head, _, sub = path.partition(".")
+        if not sub or option.get(head) is None:
+            out[head] = _value(option, option_id, head)
+        else:
+            out.setdefault(head, {})[sub] = option[head][sub]
+    return out
+
+
+@dataclass(frozen=True)
+class OptionFormat:
+    """How options are sent: the projected paths (all fields if empty) and the encoding."""
+    fields: Tuple[str, ...] = ()
+    media_type: str = JSON
+
+    @property
+    def is_default(self) -> bool:
+        # plain JSON without a projection is the existing response, without IDs
+        return not self.fields and self.media_type == JSON
+
+    def render(self, payload: Dict[str, Any], ids: List[str]) -> bytes:
+        """`payload` with its `options` projected and encoded; other keys are kept."""
+        options = payload["options"]
+        paths = self.fields or TOP_FIELDS
+        rest = {k: v for k, v in payload.items() if k != "options"}
+        if self.media_type == COLUMNAR:
+            # one array per field instead of one object per option
+            columns = [[_value(o, i, p) for o, i in zip(options, ids)] for p in paths]
+            return orjson.dumps({"fields": list(paths), "columns": columns, **rest})
+        data = {"options": [project(o, i, paths) for o, i in zip(options, ids)], **rest}
+        if self.media_type == MSGPACK:
+            return msgpack.packb(data)
+        return orjson.dumps(data)
+
+
+def option_digest(option: Dict[str, Any]) -> str:
+    unpriced = {k: v for k, v in option.items() if k != "price"}
+    return hashlib.sha256(orjson.dumps(unpriced, option=orjson.OPT_SORT_KEYS)).hexdigest()[:12]
+
+
+def _entry_of(key: str) -> str:
+    return key.rsplit(":", 1)[-1].strip("{}")
+
+
+def entry_ids(key: str, options: List[Dict[str, Any]]) -> List[str]:
+    """IDs for options cut from the flights entry `key`, which already holds their details."""
+    entry = _entry_of(key)
+    return [f"f.{entry}.{option_digest(o)}" for o in options]
+
+
+def stored_ids(options: List[Dict[str, Any]]) -> List[str]:
+    """IDs for a result list that is not a flights entry; the list is stored for lookups."""
+    body = orjson.dumps({"options": options})
+    entry = hashlib.sha256(body).hexdigest()[:32]
+    cache_set_raw(OPTIONS_KEY.format(hash_tag(entry)), body, ttl_sec=settings.ttl_sec)
+    return [f"r.{entry}.{option_digest(o)}" for o in options]
+
+
+def option_details(option_id: str, currency: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    The full option behind `option_id`, repriced in `currency` if given.
+    None once its entry has expired (the client searches again).
+    """
+    kind, _, rest = option_id.partition(".")
+    entry, _, digest = rest.partition(".")
+    if kind not in ("f", "r") or len(entry) != 32 or len(digest) != 12:
+        raise ValidationError("invalid option id")
+    key = flights_key(entry) if kind == "f" else OPTIONS_KEY.format(hash_tag(entry))
+    body = cache_get_raw(key)
+    if body is None:
+        return None
+    option = next((o for o in orjson.loads(body)["options"] if option_digest(o) == digest), None)
+    if option is not None and currency:
+        [option] = convert_options([option], currency)
+    return option
@@ -0,0 +1,117 @@
+import calendar
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from src.config import get_settings
+from src.core.services import SearchFlightsService
+from src.infra.fx import check_currency, convert
+from src.infra.price_calendar import calendar_key, cheapest_per_day, read_calendar
+from src.schemas.flight import FlightRequest
+from src.services.search_cache import search_cached
+from src.utils.deadline import Deadline
+from src.utils.logger import get_logger
+
+settings = get_settings()
+log = get_logger()
+
+MAX_CALENDAR_DAYS = 62
+
+
+def resolve_range(month: Optional[str], date_from: Optional[date],
+                  date_to: Optional[date]) -> tuple[date, date]:
+    """Turn `month=YYYY-MM` or an explicit dateFrom/dateTo into a day range."""
+    if month:
+        try:
+            y, m = [int(x) for x in month.split("-")]
+            start = date(y, m, 1)
+        except ValueError:
+            raise ValueError(f"Bad month format: {month} (expected YYYY-MM)")
+        return start, date(y, m, calendar.monthrange(y, m)[1])
+    if not date_from:
+        raise ValueError("Pass either month or dateFrom")
+    end = date_to or date_from
+    if end < date_from:
+        raise ValueError("dateTo must be on or after dateFrom")
+    if (end - date_from).days >= MAX_CALENDAR_DAYS:
+        raise ValueError(f"Range is limited to {MAX_CALENDAR_DAYS} days")
+    return date_from, end
+
+
+@dataclass
+class PriceCalendarService:
+    """
+    Cheapest price per departure day for a route, answered from the price
+    calendar index. Only days without a fresh entry go upstream.
+    """
+    search: SearchFlightsService
+
+    def _fetch_day(self, origin: str, destination: str, day: date,
+                   trip_days: Optional[int],
+                   deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        req = FlightRequest(
+            origin=origin,
+            destination=destination,
+            departureDate=day.isoformat(),
+            returnDate=(day + timedelta(days=trip_days)).isoformat() if trip_days else None,
+            nonStop=False,
+            currency=settings.base_currency,
+        )
+        try:
+            # the same flights entry a search for this day reads and writes;
+            # on a miss the service's result hooks also record the prices
+            options = orjson.loads(search_cached(self.search, req, deadline=deadline))["options"]
+        except Exception as e:
+            log.warning("[PriceCalendar] Fill for %s failed: %s", day, e)
+            return None
+        key = calendar_key(origin, destination, trip_days)
+        return cheapest_per_day(options).get((key, day.isoformat()))
+
+    def lookup(self, origin: str, destination: str, start: date, end: date,
+               trip_days: Optional[int] = None, fill: bool = True,
+               deadline: Optional[Deadline] = None,
+               currency: Optional[str] = None) -> Dict[str, Any]:
+        origin, destination = origin.upper(), destination.upper()
+        currency = check_currency(currency) if currency else None
+        start = max(start, date.today())
+        days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+        found = read_calendar(origin, destination, days, trip_days)
+
+        missing = [d for d in days if d.isoformat() not in found]
+        missing = missing[:settings.price_calendar_max_fill] if fill else []
+        if missing:
+            with ThreadPoolExecutor(max_workers=settings.price_calendar_concurrency) as pool:
+                fetched = pool.map(
+                    lambda d: self._fetch_day(origin, destination, d, trip_days, deadline),
+                    missing)
+                for day, entry in zip(missing, fetched):
+                    if entry is not None:
+                        found[day.isoformat()] = entry
+
+        # the index holds base-currency prices; convert only what is returned
+        rows: List[Dict[str, Any]] = []
+        for d in days:
+            entry = found.get(d.isoformat())
+            price = None
+            if entry:
+                price = {"amount": entry["amount"], "currency": entry["currency"]}
+                if currency:
+                    price = {"amount": convert(entry["amount"], entry["currency"], currency),
+                             "currency": currency}
+            rows.append({
+                "date": d.isoformat(),
+                "price": price,
+                "deeplink": entry["deeplink"] if entry else None,
+                "seen_at": entry["seen_at"] if entry else None,
+            })
+
+        priced = [r for r in rows if r["price"]]
+        return {
+            "origin": origin,
+            "destination": destination,
+            "trip_days": trip_days,
+            "days": rows,
+            "cheapest": min(priced, key=lambda r: r["price"]["amount"]) if priced else None,
+            "upstream_calls": len(missing),
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import base64
+import binascii
+import orjson
+from typing import Any, Dict, List
+from src.config import get_settings
+from src.core.exceptions import ValidationError
+from src.core.services import SearchFlightsService
+from src.infra.cache import make_key
+from src.infra.fx import get_fx_table
+from src.infra.redis_async import acache_get_raw
+from src.schemas.flight import FlightRequest
+from src.services.option_views import OptionFormat, entry_ids
+from src.services.search_cache import fill_cache, in_request_currency
+from src.utils.deadline import Deadline
+from src.utils.http_cache import make_etag
+
+settings = get_settings()
+
+# Sorting and paging over the cached full result set for a search key.
+# Nothing here goes upstream: a new sort or page is cut from the same entry.
+
+
+def option_duration(option: Dict[str, Any]) -> int:
+    legs = (option.get("outbound"), option.get("return_"))
+    return sum(leg["duration_min"] for leg in legs if leg)
+
+
+def _departure(option: Dict[str, Any]) -> str:
+    out = option.get("outbound")
+    return out["depart_utc"] if out else ""
+
+
+def pareto_frontier(options: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Options that no other option beats on both price and duration, cheapest first."""
+    ranked = sorted(options, key=lambda o: (o["price"]["amount"], option_duration(o)))
+    frontier, best_duration = [], None
+    for o in ranked:
+        d = option_duration(o)
+        if best_duration is None or d < best_duration:
+            frontier.append(o)
+            best_duration = d
+    return frontier
+
+
+def sort_options(options: List[Dict[str, Any]], mode: str) -> List[Dict[str, Any]]:
+    if mode == "price":
+        return sorted(options, key=lambda o: o["price"]["amount"])
+    if mode == "duration":
+        return sorted(options, key=option_duration)
+    if mode == "departure":
+        return sorted(options, key=_departure)
+    if mode == "pareto":
+        return pareto_frontier(options)
+    return options  # "default": provider order
+
+
+def _key_tag(key: str) -> str:
+    return key.rsplit(":", 1)[-1][:12]
+
+
+def encode_cursor(key: str, sort: str, offset: int) -> str:
+    raw = orjson.dumps({"k": _key_tag(key), "s": sort, "o": offset})
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, key: str) -> tuple[str, int]:
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        sort, offset, tag = data["s"], int(data["o"]), data["k"]
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise ValidationError("invalid cursor")
+    if tag != _key_tag(key):
+        raise ValidationError("cursor does not belong to this search")
+    return sort, max(0, offset)
+
+
+async def load_entry_async(service: SearchFlightsService,
+                           req: FlightRequest, deadline: Deadline | None = None) -> tuple[str, bytes]:
+    """
+    The search key and its full result set (base currency). The cache read
+    runs on the event loop (a slow Redis is a miss, not a stall) and only
+    misses, which block on the provider, go to a thread.
+    """
+    key = make_key(service.provider, req)
+    page_position(req, key)
+    body = await acache_get_raw(key)
+    if body is None:
+        body = await asyncio.to_thread(fill_cache, service, req, key, deadline)
+    return key, body
+
+
+def page_etag(body: bytes, req: FlightRequest, key: str, fmt: OptionFormat) -> str:
+    """ETag of the page `render_page` would send, without rendering it."""
+    sort, offset = page_position(req, key)
+    variant = orjson.dumps([key, sort, offset, req.max or 10,
+                            (req.currency or settings.base_currency).upper(), req.maxPrice,
+                            fmt.fields, fmt.media_type, get_fx_table().updated_at])
+    return make_etag(body, variant)
+
+
+def is_whole_entry(options: List[Dict[str, Any]], req: FlightRequest) -> bool:
+    """`req` asks for all of an entry's `options` as stored: provider order, base currency, one page."""
+    return (req.sort == "default" and not req.cursor
+            and (req.currency or settings.base_currency).upper() == settings.base_currency
+            and len(options) <= (req.max or 10))
+
+
+def render_page(body: bytes, req: FlightRequest, key: str,
+                fmt: OptionFormat | None = None) -> bytes:
+    """
+    The page of entry `body` for `req`; a non-default `fmt` projects/encodes
+    it with option IDs. Runs once per variant and process (the encoded
+    response is cached), so parsing the entry here is cheap.
+    """
+    data = orjson.loads(body)
+    # entries cached before "nextCursor" was stored go through page_view
+    if (fmt is None or fmt.is_default) and "nextCursor" in data \
+            and is_whole_entry(data["options"], req):
+        return body  # the stored bytes are the response
+    page = page_view(in_request_currency(body, req), req, key)
+    if fmt is None or fmt.is_default:
+        return orjson.dumps(page)
+    return fmt.render(page, entry_ids(key, page["options"]))
+
+
+def page_position(req: FlightRequest, key: str) -> tuple[str, int]:
+    return (req.sort, 0) if not req.cursor else decode_cursor(req.cursor, key)
+
+
+def page_view(body: bytes, req: FlightRequest, key: str) -> Dict[str, Any]:
+    """`{"options", "nextCursor"}` for the page of `body` that `req` asks for."""
+    sort, offset = page_position(req, key)
+    options = sort_options(orjson.loads(body)["options"], sort)
+    size = req.max or 10
+    page = options[offset: offset + size]
+    next_offset = offset + size
+    next_cursor = encode_cursor(key, sort, next_offset) if next_offset < len(options) else None
+    return {"options": page, "nextCursor": next_cursor}
@@ -0,0 +1,66 @@
+import orjson
+from datetime import date
+from src.infra.adaptive_ttl import entry_ttls
+from src.core.services import SearchFlightsService
+from src.infra.cache import cache_get_raw, cache_set_raw, cache_tags, make_key
+from src.infra.fx import convert_options, to_base
+from src.schemas.flight import FlightRequest, FlightResponse
+from src.utils.date_guard import coerce_future_iso
+from src.utils.deadline import Deadline
+from src.utils.logger import get_logger
+from src.config import get_settings
+
+log = get_logger()
+settings = get_settings()
+
+
+def search_cached(service: SearchFlightsService, req: FlightRequest,
+                  key: str | None = None, deadline: Deadline | None = None) -> bytes:
+    """
+    FlightResponse JSON with the full result set for `req` (up to
+    `result_set_size` options). Entries are searched and cached in the
+    base currency, so one entry serves every currency: base-currency hits
+    are returned as stored, other currencies are converted on the way out.
+    """
+    key = key or make_key(service.provider, req)
+    body = cache_get_raw(key)
+    if body is not None:
+        log.info("Cache hit for %s", key)
+    else:
+        body = fill_cache(service, req, key, deadline)
+    return in_request_currency(body, req)
+
+
+def fill_cache(service: SearchFlightsService, req: FlightRequest, key: str,
+               deadline: Deadline | None = None) -> bytes:
+    """Search upstream and cache the result set under `key` (base currency)."""
+    body = fetch_result_set(service, req, deadline)
+    [ttl] = entry_ttls([(key, departure_of(req), body)])
+    cache_set_raw(key, body, ttl_sec=ttl, tags=cache_tags(service.provider, req))
+    return body
+
+
+def departure_of(req: FlightRequest) -> date | None:
+    try:
+        return coerce_future_iso(req.departureDate)
+    except ValueError:
+        return None
+
+
+def fetch_result_set(service: SearchFlightsService, req: FlightRequest,
+                     deadline: Deadline | None = None) -> bytes:
+    """Upstream search for `req` in the base currency, as the bytes to cache."""
+    base_req = req.model_copy(update={"currency": settings.base_currency,
+                                      "maxPrice": to_base(req.maxPrice, req.currency)})
+    options = service.execute(base_req, limit=settings.result_set_size, deadline=deadline)
+    # with "nextCursor": null, so a whole entry is already a complete FlightResponse
+    return orjson.dumps(FlightResponse(options=options).model_dump())
+
+
+def in_request_currency(body: bytes, req: FlightRequest) -> bytes:
+    currency = (req.currency or settings.base_currency).upper()
+    if currency == settings.base_currency:
+        return body
+    data = orjson.loads(body)
+    data["options"] = convert_options(data["options"], currency, max_price=req.maxPrice)
+    return orjson.dumps(data)
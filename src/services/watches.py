@@ -0,0 +1,212 @@
+import threading
+import time
+import uuid
+import orjson
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from src.config import get_settings
+from src.core.services import SearchFlightsService
+from src.infra.cache import get_redis, make_key
+from src.schemas.flight import FlightRequest
+from src.services.search_cache import fill_cache
+from src.utils.logger import get_logger
+
+settings = get_settings()
+log = get_logger()
+
+WATCHES_KEY = "watch:v1:watches"          # hash: watch id -> watch JSON
+SNAPSHOT_KEY = "watch:v1:snap:{}"         # last poll summary per group
+DROPS_KEY = "watch:v1:drops:{}"           # recent price drops per group
+DUE_KEY = "watch:v1:due:{}"               # set while a group is polled / fresh
+MAX_DROPS = 50
+
+
+def group_request(watch: Dict[str, Any]) -> FlightRequest:
+    # maxPrice and currency are per-watch; the shared poll runs in the base currency
+    return FlightRequest(
+        origin=watch["origin"],
+        destination=watch["destination"],
+        departureDate=watch["departureDate"],
+        returnDate=watch.get("returnDate"),
+        nonStop=watch.get("nonStop", False),
+        currency=settings.base_currency,
+    )
+
+
+def _option_id(option: Dict[str, Any]) -> str:
+    legs = [leg for leg in (option.get("outbound"), option.get("return_")) if leg]
+    return "|".join(f"{s['carrier']}{s.get('flight_number') or ''}@{s['depart_utc']}"
+                    for leg in legs for s in leg["segments"])
+
+
+def summarize(options: List[Dict[str, Any]]) -> Dict[str, Any]:
+    prices: Dict[str, int] = {}
+    for o in options:
+        oid = _option_id(o)
+        prices[oid] = min(o["price"]["amount"], prices.get(oid, o["price"]["amount"]))
+    return {
+        "min_price": min(prices.values()) if prices else None,
+        "currency": options[0]["price"]["currency"] if options else None,
+        "count": len(options),
+        "prices": prices,
+        "polled_at": time.time(),
+    }
+
+
+def diff_snapshots(prev: Dict[str, Any], cur: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """A price-drop record if the cheapest price (or any known option) got cheaper."""
+    dropped = [oid for oid, p in cur["prices"].items()
+               if oid in prev["prices"] and p < prev["prices"][oid]]
+    old_min, new_min = prev["min_price"], cur["min_price"]
+    min_dropped = old_min is not None and new_min is not None and new_min < old_min
+    if not min_dropped and not dropped:
+        return None
+    return {
+        "old_min_price": old_min,
+        "new_min_price": new_min,
+        "currency": cur["currency"],
+        "dropped_options": len(dropped),
+        "at": cur["polled_at"],
+    }
+
+
+class WatchStore:
+    """Watches, per-group snapshots and price drops, all kept in Redis."""
+
+    def _redis(self):
+        redis = get_redis()
+        if redis is None:
+            raise RuntimeError("Redis is unavailable")
+        return redis
+
+    def create(self, fields: Dict[str, Any], provider) -> Dict[str, Any]:
+        watch = {**fields, "id": uuid.uuid4().hex, "created_at": time.time()}
+        watch["group"] = make_key(provider, group_request(watch)).rsplit(":", 1)[-1]
+        self._redis().hset(WATCHES_KEY, watch["id"], orjson.dumps(watch))
+        return watch
+
+    def get(self, watch_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._redis().hget(WATCHES_KEY, watch_id)
+        return None if raw is None else orjson.loads(raw)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [orjson.loads(v) for v in self._redis().hvals(WATCHES_KEY)]
+
+    def delete(self, watch_id: str) -> bool:
+        watch = self.get(watch_id)
+        return watch is not None and self._remove([watch]) > 0
+
+    def expire(self, today: str) -> int:
+        """Deletes watches whose departure date is before `today`; returns how many."""
+        return self._remove([w for w in self.list() if w["departureDate"] < today])
+
+    def _remove(self, watches: List[Dict[str, Any]]) -> int:
+        if not watches:
+            return 0
+        redis = self._redis()
+        removed = redis.hdel(WATCHES_KEY, *(w["id"] for w in watches))
+        # a group's snapshot and drops go with its last watch
+        live = {w["group"] for w in self.list()}
+        pipe = redis.pipeline(transaction=False)
+        for group in {w["group"] for w in watches} - live:
+            for key in (SNAPSHOT_KEY, DROPS_KEY, DUE_KEY):
+                pipe.delete(key.format(group))
+        pipe.execute()
+        return removed
+
+    def claim(self, group: str, ttl_sec: int) -> bool:
+        """True for exactly one poller per group per interval, across all workers."""
+        return bool(self._redis().set(DUE_KEY.format(group), b"1", nx=True, ex=ttl_sec))
+
+    def release(self, group: str) -> None:
+        """Makes the group due again, e.g. after a failed poll."""
+        self._redis().delete(DUE_KEY.format(group))
+
+    def snapshot(self, group: str) -> Optional[Dict[str, Any]]:
+        raw = self._redis().get(SNAPSHOT_KEY.format(group))
+        return None if raw is None else orjson.loads(raw)
+
+    def save_snapshot(self, group: str, snap: Dict[str, Any],
+                      drop: Optional[Dict[str, Any]] = None) -> None:
+        pipe = self._redis().pipeline()
+        pipe.set(SNAPSHOT_KEY.format(group), orjson.dumps(snap))
+        if drop is not None:
+            pipe.lpush(DROPS_KEY.format(group), orjson.dumps(drop))
+            pipe.ltrim(DROPS_KEY.format(group), 0, MAX_DROPS - 1)
+        pipe.execute()
+
+    def drops(self, group: str) -> List[Dict[str, Any]]:
+        return [orjson.loads(v) for v in self._redis().lrange(DROPS_KEY.format(group), 0, -1)]
+
+
+class WatchScheduler:
+    """
+    Polls watched routes in the background. Identical watches share one
+    group (same search key), and each group is polled at most once per
+    `watch_interval_sec` across all workers. At most
+    `watch_max_polls_per_tick` polls run per tick, so a backlog of due
+    groups is spread over several ticks instead of bursting the provider.
+    Watches whose departure date has passed are dropped.
+    """
+
+    def __init__(self, store: WatchStore, service: SearchFlightsService):
+        self.store = store
+        self.service = service
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def group_watches(self) -> Dict[str, Tuple[FlightRequest, List[str]]]:
+        groups: Dict[str, Tuple[FlightRequest, List[str]]] = {}
+        for w in self.store.list():
+            if w["group"] not in groups:
+                groups[w["group"]] = (group_request(w), [])
+            groups[w["group"]][1].append(w["id"])
+        return groups
+
+    def poll(self, group: str, req: FlightRequest) -> Optional[Dict[str, Any]]:
+        # always upstream: a cached entry can outlive many polls and would hide
+        # drops; the fresh result set also refreshes the entry for searches
+        key = make_key(self.service.provider, req)
+        options = orjson.loads(fill_cache(self.service, req, key))["options"]
+        snap = summarize(options)
+        prev = self.store.snapshot(group)
+        drop = diff_snapshots(prev, snap) if prev else None
+        self.store.save_snapshot(group, snap, drop)
+        if drop:
+            log.info("[Watch] %s-%s %s: price drop %s -> %s", req.origin, req.destination,
+                     req.departureDate, drop["old_min_price"], drop["new_min_price"])
+        return drop
+
+    def tick(self) -> int:
+        expired = self.store.expire(date.today().isoformat())
+        if expired:
+            log.info("[Watch] Dropped %d watches past their departure date", expired)
+        polled = 0
+        for group, (req, _) in sorted(self.group_watches().items()):
+            if polled >= settings.watch_max_polls_per_tick:
+                break
+            if not self.store.claim(group, settings.watch_interval_sec):
+                continue  # polled recently, here or by another worker
+            polled += 1
+            try:
+                self.poll(group, req)
+            except Exception as e:
+                log.warning("[Watch] Poll %s failed: %s", group, e)
+                self.store.release(group)  # retry next tick, not a full interval later
+        return polled
+
+    def _run(self) -> None:
+        while not self._stop.wait(settings.watch_tick_sec):
+            try:
+                self.tick()
+            except Exception as e:
+                log.warning("[Watch] Tick failed: %s", e)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="watch-scheduler",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,53 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's time budget is used up before a call starts."""
+    pass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Absolute, request-scoped time budget (monotonic clock)."""
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        """Timeout for the next blocking call: what's left, at most `cap`."""
+        left = self.remaining()
+        if left <= 0:
+            raise DeadlineExceeded("request deadline exceeded")
+        return min(cap, left)
+
+
+def call_timeout(deadline: "Deadline | None", cap: float) -> float:
+    return cap if deadline is None else deadline.timeout(cap)
+
+
+# For code that can't take the deadline as an argument (LLM tool calls).
+_current: ContextVar["Deadline | None"] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> "Deadline | None":
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: "Deadline | None"):
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
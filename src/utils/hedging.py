@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, TypeVar
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.logger import get_logger
+
+log = get_logger()
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Recent call latencies per name, for p95-based hedge delays."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, name: str, pct: float = 0.95) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(pct * len(samples)))]
+
+
+_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+
+
+def hedged_call(fn: Callable[[], T], delay: float,
+                deadline: Deadline | None = None) -> T:
+    """
+    Run `fn`; if it hasn't finished after `delay` seconds, start a second
+    identical call and return whichever succeeds first. The slower call is
+    left to finish (or time out) on its own; its result is dropped.
+    """
+    first = _pool.submit(fn)
+    done, _ = wait([first], timeout=delay)
+    if done:
+        return first.result()
+    if deadline is not None and deadline.remaining() <= delay:
+        # not enough budget left for a second attempt to help
+        return first.result()
+
+    log.info("Hedging slow call after %.0f ms", delay * 1000)
+    pending: set[Future] = {first, _pool.submit(fn)}
+    error: BaseException | None = None
+    while pending:
+        timeout = deadline.remaining() if deadline is not None else None
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            raise DeadlineExceeded("request deadline exceeded")
+        for fut in done:
+            if fut.exception() is None:
+                return fut.result()
+            error = fut.exception()
+    raise error
+
+
+def timed(tracker: LatencyTracker, name: str, fn: Callable[[], T]) -> Callable[[], T]:
+    """Wrap `fn` so successful calls record their latency under `name`."""
+    def run() -> T:
+        started = time.perf_counter()
+        result = fn()
+        tracker.record(name, time.perf_counter() - started)
+        return result
+    return run
@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from fastapi import Request, Response
+from src.config import get_settings
+
+try:  # optional: br is only offered when installed
+    import brotli
+except ImportError:
+    brotli = None
+
+settings = get_settings()
+
+IDENTITY = "identity"
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    # mtime=0 keeps the gzip bytes identical for identical bodies
+    "gzip": lambda raw: gzip.compress(raw, compresslevel=6, mtime=0),
+}
+if brotli is not None:
+    _COMPRESSORS["br"] = lambda raw: brotli.compress(raw, quality=5)
+_PREFERENCE = ("br", "gzip")
+
+
+def make_etag(*parts: bytes) -> str:
+    """Strong ETag for a representation identified by `parts`."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+        h.update(b"\0")
+    return f'"{h.hexdigest()}"'
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    # each Content-Encoding is its own representation with its own strong tag
+    return etag if encoding == IDENTITY else f'{etag[:-1]}-{encoding}"'
+
+
+def pick_encoding(accept_encoding: Optional[str]) -> str:
+    """The preferred encoding we can produce that `Accept-Encoding` allows."""
+    if not accept_encoding:
+        return IDENTITY
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, *params = (s.strip() for s in part.split(";"))
+        q = 1.0
+        for p in params:
+            if p.startswith("q="):
+                try:
+                    q = float(p[2:])
+                except ValueError:
+                    q = 0.0
+        accepted[name.lower()] = q
+    for encoding in _PREFERENCE:
+        if encoding in _COMPRESSORS and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return IDENTITY
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    base = etag[:-1]
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        # any encoding of the same body is the same content
+        if tag == etag or (tag.startswith(base) and tag[len(base):-1].lstrip("-") in _COMPRESSORS):
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Encoded bodies by ETag (LRU), so each response variant is serialized
+    and compressed once per process and then sent as stored.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Dict[str, Tuple[str, bytes]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encoding_of(self, etag: str, encoding: str) -> str:
+        """Encoding a 200 for this variant would use (small bodies stay uncompressed)."""
+        with self._lock:
+            known = self._items.get(etag, {}).get(encoding)
+        return known[0] if known else encoding
+
+    def body(self, etag: str, encoding: str, render: Callable[[], bytes]) -> Tuple[str, bytes]:
+        """`(encoding used, bytes)`; small bodies are sent uncompressed."""
+        with self._lock:
+            bodies = self._items.get(etag)
+            if bodies is not None:
+                self._items.move_to_end(etag)
+                if encoding in bodies:
+                    return bodies[encoding]
+                raw = bodies.get(IDENTITY)
+            else:
+                raw = None
+        if raw is None:
+            raw = (IDENTITY, render())
+        encoded = raw
+        if encoding != IDENTITY and len(raw[1]) >= settings.compress_min_bytes:
+            encoded = (encoding, _COMPRESSORS[encoding](raw[1]))
+        with self._lock:
+            bodies = self._items.setdefault(etag, {})
+            bodies[IDENTITY], bodies[encoding] = raw, encoded
+            self._items.move_to_end(etag)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return encoded
+
+
+_responses = ResponseCache(settings.response_cache_items)
+
+
+def cached_response(request: Request, etag: str, render: Callable[[], bytes],
+                    media_type: str, cache_control: str = "no-cache",
+                    headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    `304 Not Modified` when a GET/HEAD client already holds `etag`,
+    otherwise the body in the best accepted Content-Encoding. Other methods
+    always get a 200 without an ETag (a failed If-None-Match on them would
+    be a 412). `render` only runs the first time this process sends the variant.
+    """
+    conditional = request.method in ("GET", "HEAD")
+    headers = {**(headers or {}), "Vary": "Accept, Accept-Encoding"}
+    if conditional:
+        headers["Cache-Control"] = cache_control
+    encoding = pick_encoding(request.headers.get("accept-encoding"))
+    if conditional and _matches(request.headers.get("if-none-match"), etag):
+        headers["ETag"] = _encoded_etag(etag, _responses.encoding_of(etag, encoding))
+        return Response(status_code=304, headers=headers)
+    used, content = _responses.body(etag, encoding, render)
+    if conditional:
+        headers["ETag"] = _encoded_etag(etag, used)
+    if used != IDENTITY:
+        headers["Content-Encoding"] = used
+    return Response(content=content, media_type=media_type, headers=headers)
@@ -0,0 +1,86 @@
+import re
+import orjson
+from typing import Any, Iterable, Iterator
+
+# structural bytes; everything else is skipped without a Python-level loop
+_TOKENS = re.compile(rb'["\\{}\[\]:]')
+_QUOTE, _BACKSLASH, _COLON = ord('"'), ord("\\"), ord(":")
+_OPEN = (ord("{"), ord("["))
+_LBRACKET = ord("[")
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yield the elements of the array under top-level `key` of a streamed
+    JSON object, one parsed element at a time.
+
+    Only the current element is buffered. Nothing after the array is
+    read, so the caller can close the stream as soon as it has enough.
+    Non-container elements of the array are skipped.
+    """
+    target = key.encode()
+    depth = 0
+    in_str = False
+    esc_carry = False      # chunk ended right after a backslash
+    str_buf = None         # depth-1 string being captured (a key candidate)
+    last_str = None
+    field = None           # key whose value comes next at depth 1
+    array_depth = None     # depth inside the target array
+    elem = None            # bytes of the element being captured
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        skip = 1 if esc_carry else 0
+        esc_carry = False
+        str_start = 0
+        elem_start = 0
+
+        for m in _TOKENS.finditer(chunk):
+            pos = m.start()
+            if pos < skip:
+                continue
+            c = chunk[pos]
+
+            if in_str:
+                if c == _BACKSLASH:
+                    if pos + 1 >= len(chunk):
+                        esc_carry = True
+                    else:
+                        skip = pos + 2
+                elif c == _QUOTE:
+                    in_str = False
+                    if str_buf is not None:
+                        str_buf += chunk[str_start:pos]
+                        last_str, str_buf = bytes(str_buf), None
+                continue
+
+            if c == _QUOTE:
+                in_str = True
+                if depth == 1 and array_depth is None:
+                    str_buf, str_start = bytearray(), pos + 1
+            elif c == _COLON:
+                if depth == 1:
+                    field = last_str
+            elif c in _OPEN:
+                depth += 1
+                if array_depth is None:
+                    if c == _LBRACKET and depth == 2 and field == target:
+                        array_depth = depth
+                elif depth == array_depth + 1 and elem is None:
+                    elem, elem_start = bytearray(), pos
+            else:
+                depth -= 1
+                if array_depth is None:
+                    continue
+                if elem is not None and depth == array_depth:
+                    elem += chunk[elem_start:pos + 1]
+                    yield orjson.loads(elem)
+                    elem = None
+                elif depth < array_depth:
+                    return  # end of the target array
+
+        if str_buf is not None:
+            str_buf += chunk[str_start:]
+        if elem is not None:
+            elem += chunk[elem_start:]
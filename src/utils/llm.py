@@ -16,6 +16,7 @@ log = get_logger()
 settings = Settings()
 
 llm_instance = None
+small_llm_instance = None
 
 
 def get_llm_model():
@@ -34,6 +35,48 @@ def get_llm_model():
     return llm_instance
 
 
+def get_small_llm_model():
+    """Cheaper model for non-search replies (no tools)."""
+    global small_llm_instance
+
+    if small_llm_instance is not None:
+        return small_llm_instance
+
+    if not settings.groq_api_key:
+        if not settings.small_model_name:
+            # there is no default small Ollama model; a second client of the
+            # main model would only cost memory
+            log.warning("[Using] SMALL_MODEL_NAME is not set: non-search replies use "
+                        "the main model %s", settings.model_name)
+            small_llm_instance = get_llm_model()
+            return small_llm_instance
+        small_llm_instance = ChatOllama(model=settings.small_model_name, temperature=0.3)
+    else:
+        small_llm_instance = ChatGroq(
+            model=settings.small_model_name or 'llama-3.1-8b-instant',
+            temperature=0.4, api_key=settings.groq_api_key)
+
+    log.info(f"[Using] Small ModelChat: {small_llm_instance.__class__.__name__}")
+    return small_llm_instance
+
+
+def get_chat_only_prompt_template():
+    return ChatPromptTemplate.from_messages([
+        (
+            "system",
+            "You are Flight Copilot, a flight search assistant.\n"
+            "- Answer briefly (2-4 sentences).\n"
+            "- For greetings, say you can search flights, find the cheapest days "
+            "and plan multi-city trips, and ask where and when the user wants to fly.\n"
+            "- For baggage, airport or travel questions, give general guidance and "
+            "suggest checking the airline for exact rules.\n"
+            "- Never invent flight times or prices."
+        ),
+        MessagesPlaceholder("chat_history", optional=True),
+        ("human", "{input}"),
+    ])
+
+
 def get_chat_prompt_template():
     return ChatPromptTemplate.from_messages([
         (
@@ -50,7 +93,14 @@ def get_chat_prompt_template():
             "- destination (IATA)\n"
             "- date_from (YYYY-MM-DD)\n"
             "- return_date (YYYY-MM-DD) when trip length is implied\n"
-            "- max_price (number) when budget is implied\n\n"
+            "- max_price (number) when budget is implied\n"
+            "- nearby_radius_km (e.g., 100) when the user is flexible about airports "
+            "('around London', 'any airport near Tel Aviv')\n\n"
+
+            "For 'cheapest day / when is it cheapest' questions over a month or date range, "
+            "CALL cheapest_days once instead of calling search_flights for each day.\n"
+            "For trips with more than one stop-over city or an open jaw (e.g., TLV→PRG, VIE→TLV), "
+            "CALL search_multi_city once with all legs instead of chaining search_flights.\n\n"
 
             "DATE RULES\n"
             "1) Never choose past dates.\n"
@@ -0,0 +1,28 @@
+import os
+
+_FIELDS = {"Rss": "rss_kb", "Pss": "pss_kb",
+           "Private_Clean": "private_clean_kb", "Private_Dirty": "private_dirty_kb",
+           "Shared_Clean": "shared_clean_kb", "Shared_Dirty": "shared_dirty_kb"}
+
+
+def process_memory(pid: int | str = "self") -> dict:
+    """
+    RSS / PSS / USS (unique set size) of a process, in kB, from
+    /proc/<pid>/smaps_rollup (Linux only; empty dict elsewhere).
+    USS is the memory freed if this process exits, i.e. what one more
+    pre-forked worker really costs.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return {}
+
+    mem = {}
+    for line in lines:
+        name, _, rest = line.partition(":")
+        if name in _FIELDS:
+            mem[_FIELDS[name]] = int(rest.split()[0])
+    mem["uss_kb"] = mem.get("private_clean_kb", 0) + mem.get("private_dirty_kb", 0)
+    mem["pid"] = os.getpid() if pid == "self" else int(pid)
+    return mem
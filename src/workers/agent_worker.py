@@ -0,0 +1,48 @@
+"""
+Agent job worker: claims queued /api/agent/jobs entries from Redis and runs
+the LLM agent loop for each, outside the API processes. Jobs of a worker
+that dies mid-run are re-queued by the others once its lease lapses.
+
+    AGENT_JOBS_MODE=redis python -m src.workers.agent_worker --processes 2
+"""
+import argparse
+import multiprocessing
+import time
+from redis import exceptions
+from src.services.agent_jobs import RedisAgentJobs
+from src.utils.logger import get_logger
+
+log = get_logger("agent-worker")
+
+
+def work_forever() -> None:
+    jobs = RedisAgentJobs()
+    log.info("Agent worker started")
+    while True:
+        try:
+            jobs.work_one()
+        except (RuntimeError, exceptions.RedisError) as e:
+            # Redis down: back off instead of spinning
+            log.warning("Queue unavailable: %s", e)
+            time.sleep(5)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        work_forever()
+        return
+
+    procs = [multiprocessing.Process(target=work_forever, daemon=True)
+             for _ in range(args.processes)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+
+if __name__ == "__main__":
+    main()
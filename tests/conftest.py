@@ -0,0 +1,46 @@
+import sys
+from datetime import datetime, timedelta, timezone
+import pytest
+from src.core.entities import Airport, Itinerary, Money, Segment
+from src.utils.flights import itinerary_to_roundtrip
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    """In-memory Redis behind every module's `get_redis`."""
+    import src.infra.cache as cache
+    server = fakeredis.FakeRedis()
+    original = cache.get_redis
+    for module in list(sys.modules.values()):
+        if module and module.__name__.startswith("src.") \
+                and getattr(module, "get_redis", None) is original:
+            monkeypatch.setattr(module, "get_redis", lambda: server)
+    return server
+
+
+class FakeProvider:
+    """Direct TLV-style flights, one per hour; `price` is the cheapest fare."""
+
+    def __init__(self, price: int = 100, count: int = 3):
+        self.price = price
+        self.count = count
+        self.calls = []
+
+    def search(self, query, limit=10, deadline=None):
+        self.calls.append(query)
+        base = datetime.combine(query.date_from, datetime.min.time(), tzinfo=timezone.utc)
+        out = []
+        for i in range(min(limit, self.count)):
+            dep = base + timedelta(hours=6 + i)
+            seg = Segment(query.origin, query.destination, dep, dep + timedelta(minutes=120),
+                          "LY", f"LY{100 + i}")
+            out.append(itinerary_to_roundtrip(
+                Itinerary([seg], Money(self.price + 25 * i, "USD"), 120)))
+        return out
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
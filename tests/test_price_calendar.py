@@ -0,0 +1,25 @@
+from datetime import date, timedelta
+from src.core.services import SearchFlightsService
+from src.infra.cache import cache_get_raw, make_key
+from src.schemas.flight import FlightRequest
+from src.services.price_calendar import PriceCalendarService
+from src.services.search_cache import search_cached
+
+
+def _day_request(day: date) -> FlightRequest:
+    return FlightRequest(origin="TLV", destination="PRG", departureDate=day.isoformat())
+
+
+def test_calendar_and_searches_share_flights_entries(redis, provider):
+    service = SearchFlightsService(provider)
+    calendar = PriceCalendarService(search=service)
+    first = date.today() + timedelta(days=60)
+    second = first + timedelta(days=1)
+
+    search_cached(service, _day_request(first))  # an earlier regular search
+    result = calendar.lookup("TLV", "PRG", first, second)
+
+    assert [d["price"]["amount"] for d in result["days"]] == [100, 100]
+    assert [q.date_from for q in provider.calls] == [first, second]
+    # the day the calendar paid for is now a cached search
+    assert cache_get_raw(make_key(provider, _day_request(second))) is not None
@@ -0,0 +1,46 @@
+import orjson
+from src.schemas.flight import FlightRequest
+from src.services.result_views import render_page
+
+
+def _option(i: int) -> dict:
+    leg = {"origin": "TLV", "destination": "PRG", "depart_utc": f"2026-12-10T{6 + i:02d}:00:00",
+           "arrive_utc": f"2026-12-10T{8 + i:02d}:00:00", "duration_min": 120, "stops": 0,
+           "segments": [], "layovers": []}
+    # keys in an order other than the one FlightOption dumps
+    return {"carriers": ["LY"], "outbound": leg, "return_": None, "deeplink": None,
+            "price": {"currency": "USD", "amount": 100 + i}}
+
+
+def _request(**fields) -> FlightRequest:
+    return FlightRequest(origin="TLV", destination="PRG", departureDate="2026-12-10", **fields)
+
+
+def _entry(count: int) -> bytes:
+    return orjson.dumps({"options": [_option(i) for i in range(count)], "nextCursor": None})
+
+
+def test_whole_entry_check_does_not_depend_on_option_layout():
+    body = _entry(12)
+    page = orjson.loads(render_page(body, _request(max=10), "flights:v1:" + "a" * 32))
+    assert len(page["options"]) == 10
+    assert page["nextCursor"] is not None
+
+
+def test_whole_entry_is_sent_as_stored():
+    body = _entry(3)
+    assert render_page(body, _request(max=10), "flights:v1:" + "a" * 32) is body
+
+
+def test_every_page_has_the_same_shape(redis, provider):
+    from src.core.services import SearchFlightsService
+    from src.infra.cache import make_key
+    from src.services.search_cache import fill_cache
+    service = SearchFlightsService(provider)
+    req = _request(max=10)
+    key = make_key(provider, req)
+    whole = render_page(fill_cache(service, req, key), req, key)
+    sorted_page = render_page(fill_cache(service, req, key), _request(max=10, sort="price"), key)
+    legacy = render_page(orjson.dumps({"options": [_option(0)]}), req, key)
+    for body in (whole, sorted_page, legacy):
+        assert set(orjson.loads(body)) == {"options", "nextCursor"}
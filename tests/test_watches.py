@@ -0,0 +1,27 @@
+from datetime import date, timedelta
+from src.core.services import SearchFlightsService
+from src.infra.cache import make_key
+from src.services.search_cache import fill_cache
+from src.services.watches import WatchScheduler, WatchStore, group_request
+
+
+def test_poll_sees_upstream_price_behind_cached_entry(redis, provider):
+    service = SearchFlightsService(provider)
+    store = WatchStore()
+    departure = (date.today() + timedelta(days=120)).isoformat()
+    watch = store.create({"origin": "TLV", "destination": "PRG",
+                          "departureDate": departure}, provider)
+    req = group_request(watch)
+    scheduler = WatchScheduler(store, service)
+
+    scheduler.poll(watch["group"], req)
+    assert store.snapshot(watch["group"])["min_price"] == 100
+
+    # a search caches the old fare, then the fare drops upstream
+    fill_cache(service, req, make_key(provider, req))
+    provider.price = 60
+    drop = scheduler.poll(watch["group"], req)
+
+    assert drop is not None and drop["new_min_price"] == 60
+    assert store.snapshot(watch["group"])["min_price"] == 60
+    assert len(provider.calls) == 3